@@ -6,19 +6,46 @@ Uses Modrinth API to fetch and install addons (mods, resource packs, shader pack
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import pathlib
 import platform
 import shutil
+import threading
 import urllib.parse
-import urllib.request
-import urllib.error
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
+import requests
+import requests.adapters
+
 MODRINTH_BASE = "https://api.modrinth.com/v2"
 PREFIX = "palgania_launcher"
 
+# Shared HTTP session: reuses TCP/TLS connections across all Modrinth calls
+# instead of opening a new handshake per request
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": "palgania-launcher/1.0",
+    # requests l'envoie déjà par défaut, mais on l'épingle explicitement:
+    # les réponses JSON Modrinth compressées sont 3-5x plus petites
+    "Accept-Encoding": "gzip, deflate",
+})
+# Réessais avec backoff exponentiel; urllib3 honore Retry-After sur 429
+_RETRIES = requests.adapters.Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 502, 503, 504],
+)
+# Dimensionné pour les trois catégories d'addons installées de front,
+# chacune avec son pool de téléchargements parallèles
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=_RETRIES,
+))
+
 PROJECT_TYPE_MAP: Dict[str, str] = {
     "mods": "mod",
     "resourcepacks": "resourcepack",
@@ -33,11 +60,133 @@ LOADER_MAP: Dict[str, str] = {
     "iris": "iris"
 }
 
+@lru_cache(maxsize=1)
+def _default_game_dir() -> str:
+    """Répertoire Minecraft par défaut (constant sur la durée du processus)"""
+    system = platform.system().lower()
+    home = pathlib.Path.home()
+    if system == "windows":
+        appdata = os.getenv("APPDATA")
+        return str(pathlib.Path(appdata) / ".minecraft") if appdata else str(home / "AppData/Roaming/.minecraft")
+    if system == "darwin":
+        return str(home / "Library/Application Support/minecraft")
+    return str(home / ".minecraft")
+
+@lru_cache(maxsize=1)
+def _default_config_dir() -> str:
+    """Répertoire de configuration par défaut (constant sur la durée du processus)"""
+    system = platform.system().lower()
+    home = pathlib.Path.home()
+    if system == "windows":
+        return str(home / "AppData/Local/palgania_launcher")
+    if system == "darwin":
+        return str(home / "Library/Application Support/palgania_launcher")
+    return str(home / ".palgania_launcher")
+
+@lru_cache(maxsize=None)
+def _expanded_path(path_str: str) -> pathlib.Path:
+    """Résolution mémoïsée d'un chemin utilisateur (un lancement instancie
+    plusieurs managers avec les mêmes répertoires)"""
+    return pathlib.Path(path_str).expanduser()
+
+# Les fichiers de registre (local_addons.json, local_slug_cache.json) sont
+# partagés par tous les managers d'un même config_dir: sérialiser les flush
+# pour qu'une catégorie n'écrase pas les entrées d'une autre
+_LOCAL_DATA_LOCK = threading.Lock()
+
+# Même principe pour modrinth_http_cache.json, partagé par les wrappers des
+# trois managers installant en parallèle
+_HTTP_CACHE_LOCK = threading.Lock()
+
+
 class AddonNotFoundError(Exception):
     """Raised when an addon cannot be found by keyword"""
     pass
 
 class ModRinthRequestWrapper:
+    def __init__(self, cache_dir=None):
+        # Cache disque des réponses API (ETag) pour revalider à coût quasi nul
+        # les recherches répétées, et servir de fallback hors ligne
+        self.cache_dir = pathlib.Path(cache_dir).expanduser() if cache_dir else None
+        self._http_cache = self._load_http_cache()
+        # Fragment de query figé par (loaders, game_versions): identique pour
+        # tous les appels d'un même batch d'installation
+        self._versions_qs_cache: Dict[Tuple[tuple, tuple], str] = {}
+        # Mémo en mémoire: un même URL n'est interrogé qu'une fois par session
+        # (le cache ETag couvre, lui, les sessions successives)
+        self._mem_cache: Dict[str, dict] = {}
+        # Nouvelles entrées ETag en attente d'écriture: regroupées au flush()
+        # plutôt qu'une réécriture complète du fichier à chaque requête
+        self._dirty = False
+
+    def _http_cache_path(self) -> Optional[pathlib.Path]:
+        return (self.cache_dir / "modrinth_http_cache.json") if self.cache_dir else None
+
+    def _load_http_cache(self) -> Dict[str, dict]:
+        path = self._http_cache_path()
+        if path is None or not path.exists():
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def flush(self):
+        """Écrire le cache ETag sur disque s'il a changé.
+
+        Écriture atomique (tmp + os.replace) après relecture/fusion sous
+        verrou: le fichier est partagé entre wrappers concurrents et une
+        écriture directe pouvait le corrompre ou perdre leurs entrées.
+        """
+        if not self._dirty:
+            return
+        path = self._http_cache_path()
+        if path is None:
+            self._dirty = False
+            return
+        try:
+            with _HTTP_CACHE_LOCK:
+                merged = self._load_http_cache()
+                merged.update(self._http_cache)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".json.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(merged, f, separators=(",", ":"), ensure_ascii=False)
+                os.replace(tmp_path, path)
+                self._http_cache = merged
+            self._dirty = False
+        except Exception:
+            pass
+
+    def _get_json(self, url: str, timeout: int = 15) -> dict:
+        """GET JSON avec revalidation ETag (If-None-Match) et fallback hors ligne"""
+        if url in self._mem_cache:
+            return self._mem_cache[url]
+        entry = self._http_cache.get(url)
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        try:
+            resp = _SESSION.get(url, timeout=timeout, headers=headers)
+        except requests.exceptions.RequestException:
+            # Hors ligne: resservir la dernière réponse connue si disponible
+            if entry is not None:
+                return entry.get("body")
+            raise
+        if resp.status_code == 304 and entry is not None:
+            body = entry.get("body")
+            self._mem_cache[url] = body
+            return body
+        resp.raise_for_status()
+        data = resp.json()
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._http_cache[url] = {"etag": etag, "body": data}
+            self._dirty = True
+        self._mem_cache[url] = data
+        return data
+
     def search(self, query: str, facets: dict = {}, limit: int = 1, offset: int = 0, **kwargs) -> dict:
         """
         GET /search
@@ -50,80 +199,111 @@ class ModRinthRequestWrapper:
             'limit': limit,
             'offset': offset
         }))
-        req = urllib.request.Request(url, headers={"User-Agent": "palgania-launcher/1.0"})
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-        return data
-    
+        return self._get_json(url)
+
     def get_project(self, project_id: str):
         """
         GET /project/{project_id}
         """
         url = f"{MODRINTH_BASE}/project/{project_id}"
-        req = urllib.request.Request(url, headers={"User-Agent": "palgania-launcher/1.0"})
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-        return data
+        return self._get_json(url)
+
+    def get_projects(self, project_ids: List[str]) -> list:
+        """
+        GET /projects?ids=[...]
+        Récupère N projets en une seule requête
+        """
+        url = "{}/projects?{}".format(MODRINTH_BASE, urllib.parse.urlencode({
+            'ids': json.dumps(project_ids)
+        }))
+        return self._get_json(url)
     
     def get_versions(self, project_id: str, loaders : list, game_versions: list):
         """
         GET /project/{project_id}/version
         """
-        url = "{}/project/{}/version?{}".format(MODRINTH_BASE, project_id, urllib.parse.urlencode({
-            'loaders': json.dumps(loaders),
-            'game_versions': json.dumps(game_versions)
-        }))
-        req = urllib.request.Request(url, headers={"User-Agent": "palgania-launcher/1.0"})
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-        return data
-    
+        qs_key = (tuple(loaders), tuple(game_versions))
+        qs = self._versions_qs_cache.get(qs_key)
+        if qs is None:
+            qs = urllib.parse.urlencode({
+                'loaders': json.dumps(loaders),
+                'game_versions': json.dumps(game_versions)
+            })
+            self._versions_qs_cache[qs_key] = qs
+        url = f"{MODRINTH_BASE}/project/{project_id}/version?{qs}"
+        return self._get_json(url)
+
     def download_file(self, file : dict, dest_dir: pathlib.Path):
         """
         Download file from given file dict
         """
         if isinstance(dest_dir, str):
             dest_dir = pathlib.Path(dest_dir)
-        dest_dir.mkdir(parents=True, exist_ok=True)
         url = file.get("url")
         filename = file.get("filename")
         if not url:
             raise ValueError("File URL not found")
         if not filename:
             raise ValueError("File name not found")
-        req = urllib.request.Request(url, headers={"User-Agent": "palgania-launcher/1.0"})
-        with urllib.request.urlopen(req, timeout=60) as resp, open(dest_dir / f"{PREFIX}_{filename}", "wb") as f:
-            shutil.copyfileobj(resp, f)
+        with _SESSION.get(url, stream=True, timeout=60) as resp, open(dest_dir / f"{PREFIX}_{filename}", "wb") as f:
+            resp.raise_for_status()
+            # Préallouer la taille finale quand elle est connue pour limiter
+            # la fragmentation, puis copier par blocs de 1 Mio (moins de syscalls
+            # que le tampon par défaut de 16 Kio sur des JARs de plusieurs Mo)
+            content_length = resp.headers.get("Content-Length")
+            if content_length:
+                try:
+                    f.truncate(int(content_length))
+                except (OSError, ValueError):
+                    pass
+            shutil.copyfileobj(resp.raw, f, length=1 << 20)
 
 class AddonsManager:
     def __init__(self, addon_type: str, game_dir=None, loader="vanilla", version=None, config_dir=None):
         if addon_type not in PROJECT_TYPE_MAP:
             raise ValueError(f"Unsupported addon_type: {addon_type}")
         self.addon_type = addon_type
-        self.game_dir = pathlib.Path(game_dir or self._default_game_dir()).expanduser()
+        self.game_dir = _expanded_path(str(game_dir or self._default_game_dir()))
         self.loader = loader.lower()
         self.version = version
         env_cfg = os.environ.get("PALGANIA_LAUNCHER_CONFIG_DIR", "")
-        self.config_dir = pathlib.Path(config_dir or env_cfg or self._default_config_dir()).expanduser()
+        self.config_dir = _expanded_path(str(config_dir or env_cfg or self._default_config_dir()))
         self.config_dir.mkdir(parents=True, exist_ok=True)
-        self.reqw = ModRinthRequestWrapper()
+        self.reqw = ModRinthRequestWrapper(cache_dir=self.config_dir)
         self.local_addons_data = self._load_local_addons_data()
         self.local_slug_cache = self._load_local_slug_cache()
+        # Les dicts en mémoire font foi; on ne réécrit sur disque qu'au flush()
+        self._dirty = False
+        # Index (slug, loader, version) -> chemin pour des lookups O(1)
+        self._compat_index = self._build_compat_index()
+        # Index sha1 -> chemin: réutiliser un fichier au contenu identique
+        # même si Modrinth l'a renommé entre deux versions
+        self._sha1_index = {
+            data["sha1"]: data.get("file_path", "")
+            for data in self.local_addons_data.values()
+            if data.get("sha1")
+        }
         if addon_type == "shaderpacks":
             self.loader = "iris" # force iris loader for shaderpacks
         if addon_type == "resourcepacks":
             self.loader = "vanilla" # force vanilla loader for resourcepacks
+        # Catégorie Modrinth figée pour toute la durée de vie du manager
+        self.category = LOADER_MAP.get(self.loader, "minecraft")
+        # Dossiers cible/_available créés une fois ici plutôt qu'à chaque
+        # fetch (les mkdir répétés ne sont que des syscalls no-op)
+        self.addons_dir = self.game_dir / self.addon_type
+        self.available_dir = self.game_dir / f"{self.addon_type}_available"
+        self.addons_dir.mkdir(parents=True, exist_ok=True)
+        self.available_dir.mkdir(parents=True, exist_ok=True)
 
     def _load_local_data(self, file_name: str) -> Dict[str, str]:
         """
         Charger les données depuis un fichier JSON
         Retourner un dictionnaire avec les données
         """
-        #créer le fichier s'il n'existe pas
+        # Pas de stat préalable: on tente la lecture directement, le fichier
+        # sera créé par le premier flush()
         local_data_file = self.config_dir / file_name
-        if not local_data_file.exists():
-            local_data_file.write_text("{}")
-            return {}
         try:
             with open(local_data_file, "r", encoding="utf-8") as f:
                 data = json.load(f)
@@ -140,10 +320,14 @@ class AddonsManager:
         return self._load_local_data("local_slug_cache.json")
 
     def _save_local_data(self,data: Dict[str, str], file_name: str):
-        """Sauvegarder les données dans un fichier JSON"""
+        """Sauvegarder les données dans un fichier JSON (écriture atomique)"""
         local_data_file = self.config_dir / file_name
-        with open(local_data_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        # Écrire dans un fichier temporaire puis os.replace: un crash en cours
+        # d'écriture ne peut pas corrompre le fichier existant
+        tmp_file = local_data_file.with_suffix(".json.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+        os.replace(tmp_file, local_data_file)
 
     def _save_local_addons_data(self,data: Dict[str, dict]):
         """Sauvegarder les données des addons locaux dans un fichier JSON"""
@@ -153,55 +337,117 @@ class AddonsManager:
         """Sauvegarder les correspondances keyword/slug dans un fichier JSON"""
         self._save_local_data(data, "local_slug_cache.json")
 
+    def flush(self):
+        """Écrire les données en mémoire sur disque si elles ont changé.
+
+        Les trois catégories s'installent en parallèle avec chacune leur
+        manager, mais tous partagent les mêmes fichiers de registre: on relit
+        le disque et on fusionne sous verrou, sinon le dernier flush écraserait
+        les entrées écrites par les autres (ou par une exécution antérieure,
+        les managers étant réutilisés avec leur instantané en mémoire).
+        """
+        # Le cache ETag a sa propre logique si-changé; toujours le proposer
+        self.reqw.flush()
+        if not self._dirty:
+            return
+        with _LOCAL_DATA_LOCK:
+            merged_addons = self._load_local_addons_data()
+            merged_addons.update(self.local_addons_data)
+            merged_slugs = self._load_local_slug_cache()
+            merged_slugs.update(self.local_slug_cache)
+            self._save_local_addons_data(merged_addons)
+            self._save_local_slug_cache(merged_slugs)
+            self.local_addons_data = merged_addons
+            self.local_slug_cache = merged_slugs
+        self._dirty = False
+
+    @staticmethod
+    def _sha1_of_file(path: pathlib.Path) -> str:
+        """Calculer le SHA-1 d'un fichier par blocs de 1 Mio"""
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        return h.hexdigest()
+
     @staticmethod
     def _default_game_dir() -> str:
-        system = platform.system().lower()
-        home = pathlib.Path.home()
-        if system == "windows":
-            appdata = os.getenv("APPDATA")
-            return str(pathlib.Path(appdata) / ".minecraft") if appdata else str(home / "AppData/Roaming/.minecraft")
-        if system == "darwin":
-            return str(home / "Library/Application Support/minecraft")
-        return str(home / ".minecraft")
+        return _default_game_dir()
 
     @staticmethod
     def _default_config_dir() -> str:
-        system = platform.system().lower()
-        home = pathlib.Path.home()
-        if system == "windows":
-            return str(home / "AppData/Local/palgania_launcher")
-        if system == "darwin":
-            return str(home / "Library/Application Support/palgania_launcher")
-        return str(home / ".palgania_launcher")
-    
+        return _default_config_dir()
+
+    def _build_compat_index(self) -> Dict[Tuple[str, str, str], str]:
+        """Construire l'index (slug, loader, game_version) -> file_path"""
+        index: Dict[Tuple[str, str, str], str] = {}
+        for _, data in self.local_addons_data.items():
+            slug = data.get("slug")
+            file_path = data.get("file_path", "")
+            if not slug or not file_path:
+                continue
+            for loader in data.get("loaders", []):
+                for game_version in data.get("game_versions", []):
+                    index[(slug, loader, game_version)] = file_path
+        return index
+
+    def _index_addon_entry(self, data: dict):
+        """Ajouter une entrée d'addon à l'index de compatibilité"""
+        slug = data.get("slug")
+        file_path = data.get("file_path", "")
+        if not slug or not file_path:
+            return
+        for loader in data.get("loaders", []):
+            for game_version in data.get("game_versions", []):
+                self._compat_index[(slug, loader, game_version)] = file_path
+
+    def _locate_local_file(self, file_path: pathlib.Path) -> Optional[pathlib.Path]:
+        """Retrouver un fichier addon local: dans _available, ou déjà installé
+        dans le dossier cible (l'installation déplace sans garder de copie)"""
+        if file_path.exists():
+            return file_path
+        installed_path = self.addons_dir / file_path.name
+        if installed_path.exists():
+            return installed_path
+        return None
+
     def _fetch_local_addon(self, slug_or_keyword: str) -> Optional[pathlib.Path]:
         """Fetch a local addon by keyword from the local addons data"""
-        slug = self._load_local_slug_cache().get(slug_or_keyword, slug_or_keyword)
-        category = LOADER_MAP.get(self.loader, "minecraft")
-        for _, data in self.local_addons_data.items():
-            if slug == data.get("slug") and self.version in data.get("game_versions", []) and category in data.get("loaders", []):
-                file_path = pathlib.Path(data.get("file_path", ""))
-                if file_path.exists():
-                    return file_path
+        slug = self.local_slug_cache.get(slug_or_keyword, slug_or_keyword)
+        file_path_str = self._compat_index.get((slug, self.category, self.version))
+        if file_path_str:
+            return self._locate_local_file(pathlib.Path(file_path_str))
         return None
     
     def fetch_keyword(self, keyword: str) -> Optional[pathlib.Path]:
         # Retourner le chemin du fichier addon téléchargé/existant
         # ou lever AddonNotFoundError
-        category = LOADER_MAP.get(self.loader, "minecraft")
-        try: 
-            hits = self.reqw.search(
-                query=keyword,
-                project_type=PROJECT_TYPE_MAP[self.addon_type],
-                categories=category,
-                facets={"versions": self.version} if self.version else {}
-            ).get("hits", [])
-            if len(hits) == 0:
-                raise AddonNotFoundError(f"No addon found for keyword: {keyword}")
-            project = hits[0]
-            project_slug = project.get("slug")
-            self.local_slug_cache[keyword] = project_slug
-            self._save_local_slug_cache(self.local_slug_cache)
+        category = self.category
+        try:
+            # Slug déjà résolu lors d'une installation précédente: sauter la
+            # recherche et passer directement à la résolution de version
+            project_slug = self.local_slug_cache.get(keyword)
+            if project_slug is None:
+                hits = self.reqw.search(
+                    query=keyword,
+                    project_type=PROJECT_TYPE_MAP[self.addon_type],
+                    categories=category,
+                    facets={"versions": self.version} if self.version else {},
+                    limit=10
+                ).get("hits", [])
+                if len(hits) == 0:
+                    raise AddonNotFoundError(f"No addon found for keyword: {keyword}")
+                # Une seule recherche: préférer un hit qui déclare la version
+                # demandée plutôt que d'enchaîner des recherches de repli
+                project = hits[0]
+                if self.version:
+                    for hit in hits:
+                        if self.version in hit.get("versions", []):
+                            project = hit
+                            break
+                project_slug = project.get("slug")
+                self.local_slug_cache[keyword] = project_slug
+                self._dirty = True
 
             versions = self.reqw.get_versions(
                 project_id=project_slug,
@@ -217,20 +463,46 @@ class AddonsManager:
                 raise AddonNotFoundError(f"No files found for addon version: {keyword}")
             file = files[0]
             filename = file.get("filename")
-            addons_dir = self.game_dir / (f"{self.addon_type}_available")
-            addons_dir.mkdir(parents=True, exist_ok=True)
+            expected_sha1 = file.get("hashes", {}).get("sha1")
+            expected_size = file.get("size")
+            addons_dir = self.available_dir
             if filename in self.local_addons_data:
                 local_data = self.local_addons_data[filename]
-                local_file_path = pathlib.Path(local_data.get("file_path", ""))
-                if local_file_path.exists():
+                local_file_path = self._locate_local_file(pathlib.Path(local_data.get("file_path", "")))
+                if local_file_path is not None:
                     # Vérifier si la version locale correspond à la version demandée
+                    # et que le contenu est intègre (taille attendue; un download
+                    # interrompu ne doit pas être considéré valide pour toujours)
                     if (local_data.get("version_number") == version.get("version_number") and
                         set(local_data.get("game_versions", [])) == set(version.get("game_versions", [])) and
-                        set(local_data.get("loaders", [])) == set(version.get("loaders", []))):
+                        set(local_data.get("loaders", [])) == set(version.get("loaders", [])) and
+                        (expected_size is None or local_file_path.stat().st_size == expected_size)):
                         return local_file_path
 
-            self.reqw.download_file(file, f"{addons_dir}")
             downloaded_path = addons_dir / f"{PREFIX}_{filename}"
+            # Contenu identique déjà présent sous un autre nom (clé sha1):
+            # le relier au nom attendu plutôt que de re-télécharger
+            reused = None
+            if expected_sha1:
+                known_path = self._sha1_index.get(expected_sha1)
+                if known_path:
+                    reused = self._locate_local_file(pathlib.Path(known_path))
+            if reused is not None:
+                if reused != downloaded_path:
+                    try:
+                        os.link(reused, downloaded_path)
+                    except OSError:
+                        shutil.copy2(reused, downloaded_path)
+            else:
+                self.reqw.download_file(file, f"{addons_dir}")
+            # Vérifier l'intégrité du téléchargement via le SHA-1 Modrinth
+            if expected_sha1 and self._sha1_of_file(downloaded_path) != expected_sha1:
+                downloaded_path.unlink(missing_ok=True)
+                # Nouvelle tentative unique avant d'abandonner
+                self.reqw.download_file(file, f"{addons_dir}")
+                if self._sha1_of_file(downloaded_path) != expected_sha1:
+                    downloaded_path.unlink(missing_ok=True)
+                    raise AddonNotFoundError(f"Checksum mismatch for addon file: {filename}")
             # Mettre à jour les données locales
             if filename not in self.local_addons_data:
                 self.local_addons_data[filename] = {}
@@ -240,82 +512,88 @@ class AddonsManager:
                 "game_versions": version.get("game_versions", []),
                 "loaders": version.get("loaders", []),
                 "version_number": version.get("version_number", ""),
+                "sha1": expected_sha1 or "",
+                "size": expected_size,
             }
-            self._save_local_addons_data(self.local_addons_data)
+            self._index_addon_entry(self.local_addons_data[filename])
+            if expected_sha1:
+                self._sha1_index[expected_sha1] = str(downloaded_path)
+            self._dirty = True
             return downloaded_path
-        except urllib.error.HTTPError as e:
+        except requests.exceptions.HTTPError as e:
             print(e)
             filename = self._fetch_local_addon(keyword)
             if filename:
                 print(f"Using local addon for keyword '{keyword}': {filename}")
                 return filename
-            raise AddonNotFoundError(f"HTTP Error fetching addon: {e.code} - {e.reason}")
-        except urllib.error.URLError as e:
+            status = e.response.status_code if e.response is not None else "?"
+            raise AddonNotFoundError(f"HTTP Error fetching addon: {status} - {e}")
+        except requests.exceptions.RequestException as e:
             filename = self._fetch_local_addon(keyword)
             if filename:
                 print(f"Using local addon for keyword '{keyword}': {filename}")
                 return filename
-            raise AddonNotFoundError(f"URL Error fetching addon: {e.reason}")
+            raise AddonNotFoundError(f"URL Error fetching addon: {e}")
     
     def install_addons(self, keywords: List[str]) -> List[pathlib.Path]:
         # Installer les addons depuis mods_available vers mods
         # ou lever AddonNotFoundError
-        
-        # Approche transactionnelle : on télécharge tout dans un dossier temporaire d'abord
-        # Si tout réussit, alors on wipe le dossier réel et on déplace.
-        
-        import tempfile
-        
-        addons_dir = self.game_dir / self.addon_type
-        addons_available_dir = self.game_dir / f"{self.addon_type}_available"
-        addons_available_dir.mkdir(parents=True, exist_ok=True)
-        addons_dir.mkdir(parents=True, exist_ok=True)
-
-        temp_install_dir = pathlib.Path(tempfile.mkdtemp(prefix=f"palgania_{self.addon_type}_"))
-        
+
+        # Approche tout-ou-rien sans copie d'octets: fetch_keyword place tout
+        # dans _available, puis une fois chaque fichier vérifié présent il ne
+        # reste que des renames sur le même système de fichiers.
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        addons_dir = self.addons_dir
+        addons_available_dir = self.available_dir
+
         try:
-            installed_paths = []
             print(f"Préparation de l'installation des {self.addon_type}...")
-            
-            # 1. Télécharger ou récupérer tous les addons demandés dans le dossier unique disponible
-            # Puis les copier dans le dossier temp
-            for keyword in keywords:
-                # fetch_keyword télécharge dans _available
-                source_path = self.fetch_keyword(keyword)
-                if source_path and source_path.exists():
-                    dest_path = temp_install_dir / source_path.name
-                    shutil.copy2(source_path, dest_path)
-                    installed_paths.append(dest_path)
-                else:
+
+            # 1. Télécharger ou récupérer tous les addons demandés
+            # Les fetchs sont surtout de l'attente réseau: on les lance en parallèle
+            # sur la session partagée (keep-alive)
+            if keywords:
+                with ThreadPoolExecutor(max_workers=min(8, len(keywords))) as executor:
+                    source_paths = list(executor.map(self.fetch_keyword, keywords))
+            else:
+                source_paths = []
+            # Tout vérifier avant de toucher au dossier cible (garantie tout-ou-rien)
+            for keyword, source_path in zip(keywords, source_paths):
+                if not (source_path and source_path.exists()):
                     raise AddonNotFoundError(f"Addon not found/downloaded for keyword: {keyword}")
-            
-            # 2. Si on arrive ici, tous les addons sont prêts dans temp_install_dir.
-            # On peut nettoyer le dossier cible (mods/resourcepacks)
-            # En ne gardant que ce qu'on veut (ou tout supprimer ? La demande implique une installation propre)
-            # Pour la sûreté, on déplace les anciens fichiers dans _available (backup) s'ils ont notre préfixe
-            for item in addons_dir.iterdir():
-                if item.is_file() and item.name.startswith(PREFIX):
-                    try:
-                        shutil.move(str(item), str(addons_available_dir / item.name))
-                    except shutil.Error:
-                        pass # Déjà existant
-            
-            # 3. Déplacer les nouveaux fichiers depuis temp vers cible
+
+            # 2. Écarter les anciens fichiers gérés vers _available (backup),
+            # sauf ceux déjà en place qui font partie de la sélection
+            # os.scandir évite d'allouer un Path + stat par fichier (DirEntry
+            # réutilise les infos du listing)
+            keep_names = {p.name for p in source_paths if p.parent == addons_dir}
+            with os.scandir(addons_dir) as entries:
+                managed_entries = [e for e in entries if e.name.startswith(PREFIX) and e.is_file()]
+            for entry in managed_entries:
+                if entry.name in keep_names:
+                    continue
+                # Même système de fichiers (tous deux sous game_dir):
+                # os.replace = un seul rename atomique, écrase l'existant
+                os.replace(entry.path, addons_available_dir / entry.name)
+
+            # 3. Renommer les nouveaux fichiers vers la cible (aucun octet copié)
             final_paths = []
-            for temp_file in installed_paths:
-                final_dest = addons_dir / temp_file.name
-                shutil.move(str(temp_file), str(final_dest))
+            for source_path in source_paths:
+                final_dest = addons_dir / source_path.name
+                if source_path != final_dest:
+                    os.replace(source_path, final_dest)
                 final_paths.append(final_dest)
-                
+
             return final_paths
 
         except Exception as e:
             print(f"Abandon de l'installation des addons: {e}")
             raise e
         finally:
-            # Nettoyage du dossier temporaire
-            if temp_install_dir.exists():
-                shutil.rmtree(temp_install_dir, ignore_errors=True)
+            # Persister les caches mémoire (une seule écriture pour tout le lot)
+            self.flush()
 
 # am = AddonsManager(addon_type="mods",loader="fabric",version="1.21.11")
 # bm = AddonsManager(addon_type="resourcepacks",version="1.21.11")
@@ -2,10 +2,36 @@ import customtkinter as ctk
 import json
 import os
 import sys
+
+try:
+    # Facultatif: parse/sérialise le JSON nettement plus vite que le module json
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _read_json(path):
+    """Lire un fichier JSON (orjson si disponible, sinon json standard)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _write_json(path, obj):
+    """Écrire un fichier JSON indenté (format identique quel que soit le backend)."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
 from PIL import Image, ImageTk
-from versions import get_version_groups, refresh_version_groups_async
+from versions import get_cached_version_groups, refresh_version_groups_async, refresh_all_async
+import tkinter as tk
 from tkinter import filedialog, messagebox
-import shlex
 from portablemc.standard import (
     Version, Context, Watcher,
     VersionLoadingEvent, VersionFetchingEvent, VersionLoadedEvent,
@@ -23,15 +49,19 @@ from portablemc.auth import (
 )
 from portablemc.forge import ForgeVersion, _NeoForgeVersion
 from portablemc.fabric import FabricVersion
+import atexit
+import functools
+import hashlib
 import pathlib
+import re
+import time
 import logging
-from datetime import datetime
-import webbrowser
-import urllib.parse
-import urllib.error
+import logging.handlers
+import queue
 from uuid import uuid4
-import struct
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from addons_manager import AddonsManager, AddonNotFoundError
 from typing import Optional
 import sys
@@ -65,14 +95,14 @@ def _parse_config_dir_arg(argv: list[str]) -> Optional[pathlib.Path]:
     return None
 
 
+# PyInstaller creates a temp folder and stores path in _MEIPASS;
+# résolu une seule fois à l'import (et indépendant du répertoire courant)
+_BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.dirname(os.path.abspath(__file__))
+
+
 def resource_path(relative_path: str) -> str:
     """Get absolute path to resource, works for dev and for PyInstaller"""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)
 
 CONFIG_DIR = _parse_config_dir_arg(sys.argv) or _default_config_dir()
 CONFIG_DIR.mkdir(parents=True, exist_ok=True)
@@ -84,7 +114,12 @@ LOG_FILE = str(CONFIG_DIR / "palgania-launcher.latest.log")
 AUTH_DATABASE_FILE = str(CONFIG_DIR / "portablemc_auth.json")
 LAST_ACCOUNT_FILE = str(CONFIG_DIR / "last_account.txt")
 LAST_PROFILE_FILE = str(CONFIG_DIR / "last_profile.txt")
+ADDONS_CACHE_FILE = str(CONFIG_DIR / "addons_cache.json")
+# Durée de validité d'une installation d'addons vérifiée (en secondes)
+ADDONS_CACHE_TTL = 24 * 3600
 MICROSOFT_AZURE_APP_ID = "708e91b5-99f8-4a1d-80ec-e746cbb24771"  # App ID du CLI portablemc
+# Partie fixe de la query d'authentification, encodée au premier login
+_AUTH_URL_FIXED = None
 
 # Loader mapping for version groups
 LOADER_MAP = {
@@ -94,154 +129,284 @@ LOADER_MAP = {
     "Neoforge": "neoforge"
 }
 
-VERSION_GROUPS = get_version_groups("vanilla")
+# Unités de taille pour l'affichage (indexées par multiple de 1024)
+_SIZE_UNITS = ('o', 'Ko', 'Mo', 'Go', 'To')
+
+
+def _nbt_name(s):
+    """Encoder un nom de tag NBT (longueur big-endian sur 2 octets + UTF-8)."""
+    encoded = s.encode('utf-8')
+    return len(encoded).to_bytes(2, 'big') + encoded
+
 
-# Configuration du logging
-logging.basicConfig(
-    filename=LOG_FILE,
-    level=logging.INFO,
-    format='[%(asctime)s] [%(levelname)s] %(message)s',
+# En-têtes NBT précalculés (octet de type + nom encodé) pour servers.dat:
+# évite de ré-encoder les mêmes noms de tags à chaque serveur écrit
+_NBT_STR_NAME = b'\x08' + _nbt_name("name")
+_NBT_STR_IP = b'\x08' + _nbt_name("ip")
+_NBT_BYTE_ACCEPT_TEXTURES = b'\x01' + _nbt_name("acceptTextures")
+_NBT_LIST_SERVERS = b'\x09' + _nbt_name("servers")
+
+def _log_bg_exception(future):
+    """Journaliser l'exception d'une tâche de fond (sinon perdue par le pool)."""
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Tâche de fond échouée: %s", exc, exc_info=exc)
+
+
+def _addons_fingerprint(addon_type, game_dir, loader, version, keys):
+    """Empreinte courte d'une combinaison catégorie/réglages/mots-clés."""
+    raw = f"{addon_type}|{game_dir or ''}|{loader}|{version}|{','.join(sorted(keys))}"
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=12).hexdigest()
+
+
+@functools.lru_cache(maxsize=16)
+def _split_jvm_args(raw: str):
+    """Tokeniser les arguments JVM personnalisés (résultat mémoïsé).
+
+    La chaîne vient des réglages avancés et change rarement: inutile de
+    repasser le tokenizer shlex à chaque lancement.
+    """
+    import shlex  # import différé: uniquement pour ce parsing
+    try:
+        return tuple(shlex.split(raw))
+    except ValueError:
+        return tuple(raw.split())
+
+
+# Adresse quickplay: schéma optionnel, hôte IPv6 entre crochets ou hôte
+# simple, port optionnel — un seul passage d'automate au lieu de plusieurs
+# découpages de chaîne par lancement
+_ADDR_RE = re.compile(
+    r'^(?:[a-z]+://)?(?:\[(?P<h6>[^\]]+)\](?::(?P<p6>\d+))?|(?P<h>[^:/]+)(?::(?P<p>\d+))?)$',
+    re.I,
+)
+
+# Configuration du logging: les threads n'écrivent que dans une file en mémoire,
+# un QueueListener en arrière-plan se charge des écritures disque
+_log_queue = queue.Queue(-1)
+_file_handler = logging.FileHandler(LOG_FILE, mode='w')  # Écrase le fichier à chaque démarrage
+_file_handler.setFormatter(logging.Formatter(
+    fmt='[%(asctime)s] [%(levelname)s] %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S',
-    filemode='w'  # Écrase le fichier à chaque démarrage
+))
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _file_handler, respect_handler_level=True
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logging.root.setLevel(logging.INFO)
+logging.root.addHandler(logging.handlers.QueueHandler(_log_queue))
 logger = logging.getLogger(__name__)
 
 class InstallWatcher(Watcher):
     """Moniteur d'installation pour afficher la progression dans l'UI et le log."""
-    
+
+    # Libellés des types de JVM, construits une fois au chargement de la classe
+    _JVM_KIND_LABELS = {
+        JvmLoadedEvent.MOJANG: "Mojang",
+        JvmLoadedEvent.BUILTIN: "système",
+        JvmLoadedEvent.CUSTOM: "personnalisée",
+    }
+
+
     def __init__(self, app):
         super().__init__()
         self.app = app  # Référence à l'application pour mettre à jour l'UI
         self.download_size = 0
         self.download_total = 0
         self.entries_count = 0
+        # Les événements de progression arrivent des threads de téléchargement
+        # bien plus vite que l'UI ne peut raisonnablement se redessiner: ils ne
+        # font que mettre à jour ces valeurs, un tick périodique (~10 Hz) sur
+        # le thread Tk les applique aux widgets
+        self._lock = threading.Lock()
+        self._latest_msg = ""
+        self._latest_progress = 0.0
+        self._ticking = False
+        self._total_str = ""  # taille totale formatée, figée au DownloadStart
+        # Widgets résolus une fois (le watcher est créé après setup_ui);
+        # évite un hasattr à chaque callback UI
+        self._status = getattr(app, 'status_label', None)
+        self._progress = getattr(app, 'progress_bar', None)
+        # Dernières valeurs affichées, pour éviter les appels Tcl sans effet
+        # visible (barre ~300px: un delta < 0.5% est invisible)
+        self._last_shown_msg = None
+        self._last_shown_progress = -1.0
         
     def handle(self, event):
-        """Gère les événements d'installation avec affichage adapté et journalisation."""
-        
-        # === Version Events ===
-        if isinstance(event, VersionLoadingEvent):
-            msg = f"Chargement de la version {event.version}..."
-            logger.info(f"VersionLoadingEvent: {event.version}")
-            self._update_status(msg)
-            
-        elif isinstance(event, VersionFetchingEvent):
-            msg = f"Téléchargement des métadonnées de {event.version}..."
-            logger.info(f"VersionFetchingEvent: {event.version}")
-            self._update_status(msg)
-            
-        elif isinstance(event, VersionLoadedEvent):
-            msg = f"Version {event.version} {'téléchargée' if event.fetched else 'chargée'}"
-            logger.info(f"VersionLoadedEvent: {event.version} (fetched={event.fetched})")
-            self._update_status(msg, success=True)
-            
-        # === Features Event ===
-        elif isinstance(event, FeaturesEvent):
-            msg = f"Fonctionnalités: {', '.join(event.features) if event.features else 'aucune'}"
-            logger.info(f"FeaturesEvent: {event.features}")
-            self._update_status(msg, info=True)
-            
-        # === JAR Event ===
-        elif isinstance(event, JarFoundEvent):
-            msg = "Fichier JAR du jeu trouvé"
-            logger.info("JarFoundEvent")
-            self._update_status(msg, success=True)
-            
-        # === Assets Events ===
-        elif isinstance(event, AssetsResolveEvent):
-            if event.count is None:
-                msg = f"Vérification des assets (index {event.index_version})..."
-                logger.info(f"AssetsResolveEvent: resolving index {event.index_version}")
-            else:
-                msg = f"Assets vérifiés: {event.count} fichiers (index {event.index_version})"
-                logger.info(f"AssetsResolveEvent: resolved {event.count} assets (index {event.index_version})")
-            self._update_status(msg, success=(event.count is not None))
-            
-        # === Libraries Events ===
-        elif isinstance(event, LibrariesResolvingEvent):
-            msg = "Vérification des bibliothèques..."
-            logger.info("LibrariesResolvingEvent")
-            self._update_status(msg)
-            
-        elif isinstance(event, LibrariesResolvedEvent):
-            msg = f"Bibliothèques vérifiées: {event.class_libs_count} classpath, {event.native_libs_count} natives"
-            logger.info(f"LibrariesResolvedEvent: {event.class_libs_count} class libs, {event.native_libs_count} native libs")
-            self._update_status(msg, success=True)
-            
-        # === Logger Event ===
-        elif isinstance(event, LoggerFoundEvent):
-            msg = f"Logger configuré: {event.version}"
-            logger.info(f"LoggerFoundEvent: {event.version}")
-            self._update_status(msg, info=True)
-            
-        # === JVM Events ===
-        elif isinstance(event, JvmLoadingEvent):
-            msg = "Chargement de la JVM..."
-            logger.info("JvmLoadingEvent")
-            self._update_status(msg)
-            
-        elif isinstance(event, JvmLoadedEvent):
-            kind_label = {
-                JvmLoadedEvent.MOJANG: "Mojang",
-                JvmLoadedEvent.BUILTIN: "système",
-                JvmLoadedEvent.CUSTOM: "personnalisée"
-            }.get(event.kind, event.kind)
-            version_str = f" {event.version}" if event.version else ""
-            msg = f"JVM chargée: {kind_label}{version_str}"
-            logger.info(f"JvmLoadedEvent: kind={event.kind}, version={event.version}")
-            self._update_status(msg, success=True)
-            
-        # === Download Events ===
-        elif isinstance(event, DownloadStartEvent):
-            self.download_total = event.size
-            self.entries_count = event.entries_count
-            self.download_size = 0
-            msg = f"Téléchargement de {event.entries_count} fichiers ({self._format_size(event.size)})..."
-            logger.info(f"DownloadStartEvent: {event.entries_count} entries, {event.size} bytes, {event.threads_count} threads")
-            self._update_status(msg)
-            self._show_progress_bar()
-            self._update_progress(0)
-            
-        elif isinstance(event, DownloadProgressEvent):
-            # Mise à jour de la barre de progression
+        """Gère les événements d'installation avec affichage adapté et journalisation.
+
+        Dispatch par type exact (les événements portablemc sont des classes
+        concrètes): un seul lookup dict au lieu de parcourir une échelle
+        d'isinstance pour chaque événement de progression.
+        """
+        t = type(event)
+        # Cas de loin le plus fréquent en jeu: une ligne de log XML par
+        # événement, traitée avant tout autre coût de dispatch
+        if t is XmlStreamEvent:
+            self._on_xml_stream(event)
+            return
+        handler = self._DISPATCH.get(t)
+        if handler is not None:
+            handler(self, event)
+        else:
+            logger.debug("Unknown event: %s", t.__name__)
+
+    # === Version Events ===
+    def _on_version_loading(self, event):
+        msg = f"Chargement de la version {event.version}..."
+        logger.info("VersionLoadingEvent: %s", event.version)
+        self._update_status(msg)
+
+    def _on_version_fetching(self, event):
+        msg = f"Téléchargement des métadonnées de {event.version}..."
+        logger.info("VersionFetchingEvent: %s", event.version)
+        self._update_status(msg)
+
+    def _on_version_loaded(self, event):
+        msg = f"Version {event.version} {'téléchargée' if event.fetched else 'chargée'}"
+        logger.info("VersionLoadedEvent: %s (fetched=%s)", event.version, event.fetched)
+        self._update_status(msg, success=True)
+
+    # === Features Event ===
+    def _on_features(self, event):
+        msg = f"Fonctionnalités: {', '.join(event.features) if event.features else 'aucune'}"
+        logger.info("FeaturesEvent: %s", event.features)
+        self._update_status(msg, info=True)
+
+    # === JAR Event ===
+    def _on_jar_found(self, event):
+        msg = "Fichier JAR du jeu trouvé"
+        logger.info("JarFoundEvent")
+        self._update_status(msg, success=True)
+
+    # === Assets Events ===
+    def _on_assets_resolve(self, event):
+        if event.count is None:
+            msg = f"Vérification des assets (index {event.index_version})..."
+            logger.info("AssetsResolveEvent: resolving index %s", event.index_version)
+        else:
+            msg = f"Assets vérifiés: {event.count} fichiers (index {event.index_version})"
+            logger.info("AssetsResolveEvent: resolved %s assets (index %s)", event.count, event.index_version)
+        self._update_status(msg, success=(event.count is not None))
+
+    # === Libraries Events ===
+    def _on_libraries_resolving(self, event):
+        msg = "Vérification des bibliothèques..."
+        logger.info("LibrariesResolvingEvent")
+        self._update_status(msg)
+
+    def _on_libraries_resolved(self, event):
+        msg = f"Bibliothèques vérifiées: {event.class_libs_count} classpath, {event.native_libs_count} natives"
+        logger.info("LibrariesResolvedEvent: %s class libs, %s native libs", event.class_libs_count, event.native_libs_count)
+        self._update_status(msg, success=True)
+
+    # === Logger Event ===
+    def _on_logger_found(self, event):
+        msg = f"Logger configuré: {event.version}"
+        logger.info("LoggerFoundEvent: %s", event.version)
+        self._update_status(msg, info=True)
+
+    # === JVM Events ===
+    def _on_jvm_loading(self, event):
+        msg = "Chargement de la JVM..."
+        logger.info("JvmLoadingEvent")
+        self._update_status(msg)
+
+    def _on_jvm_loaded(self, event):
+        kind_label = self._JVM_KIND_LABELS.get(event.kind, event.kind)
+        version_str = f" {event.version}" if event.version else ""
+        msg = f"JVM chargée: {kind_label}{version_str}"
+        logger.info("JvmLoadedEvent: kind=%s, version=%s", event.kind, event.version)
+        self._update_status(msg, success=True)
+
+    # === Download Events ===
+    def _on_download_start(self, event):
+        self.download_total = event.size
+        self.entries_count = event.entries_count
+        self.download_size = 0
+        self._total_str = self._format_size(event.size)
+        msg = f"Téléchargement de {event.entries_count} fichiers ({self._total_str})..."
+        logger.info("DownloadStartEvent: %s entries, %s bytes, %s threads", event.entries_count, event.size, event.threads_count)
+        self._update_status(msg)
+        self._show_progress_bar()
+        self._update_progress(0)
+        # Démarrer le tick d'affichage throttlé
+        self._ticking = True
+        self.app.after(100, self._tick)
+
+    def _on_download_progress(self, event):
+        # Pas de callback Tk ici: seulement mettre à jour les compteurs,
+        # le tick périodique s'occupe de l'affichage
+        with self._lock:
             if event.done:
                 self.download_size += event.size
-            
             progress = (self.download_size / self.download_total * 100) if self.download_total > 0 else 0
-            msg = f"Téléchargement: {event.count}/{self.entries_count} ({self._format_size(self.download_size)}/{self._format_size(self.download_total)}) - {self._format_size(event.speed)}/s"
-            
-            # Log périodiquement (tous les 10 fichiers pour éviter de saturer)
-            if event.done and event.count % 10 == 0:
-                logger.info(f"DownloadProgressEvent: {event.count}/{self.entries_count} files, {event.speed:.1f} B/s")
-            
-            self._update_status(msg, progress=True)
-            self._update_progress(progress)
-            
-        elif isinstance(event, DownloadCompleteEvent):
-            msg = f"Téléchargement terminé: {self.entries_count} fichiers ({self._format_size(self.download_size)})"
-            logger.info("DownloadCompleteEvent")
-            self._update_status(msg, success=True)
-            self._update_progress(100)
-            # Masquer la barre après un court délai pour voir la complétion
-            self.app.after(1500, self._hide_progress_bar)
-            
-        # === Game Stream Event (logs du jeu) ===
-        elif isinstance(event, XmlStreamEvent):
-            # Log uniquement les événements importants (warnings/errors)
-            if event.level in ("WARN", "ERROR", "FATAL"):
-                logger.warning(f"GameLog [{event.level}] {event.logger}: {event.message}")
-            # Info optionnel (décommentez si vous voulez tous les logs du jeu)
-            # else:
-            #     logger.debug(f"GameLog [{event.level}] {event.logger}: {event.message}")
-        
-        # === Unknown Event ===
-        else:
-            logger.debug(f"Unknown event: {type(event).__name__}")
+            self._latest_progress = progress
+            self._latest_msg = f"Téléchargement: {event.count}/{self.entries_count} ({self._format_size(self.download_size)}/{self._total_str}) - {self._format_size(event.speed)}/s"
+
+        # Log périodiquement (tous les 10 fichiers pour éviter de saturer)
+        if event.done and event.count % 10 == 0:
+            logger.info("DownloadProgressEvent: %s/%s files, %.1f B/s", event.count, self.entries_count, event.speed)
+
+    def _on_download_complete(self, event):
+        self._ticking = False
+        msg = f"Téléchargement terminé: {self.entries_count} fichiers ({self._format_size(self.download_size)})"
+        logger.info("DownloadCompleteEvent")
+        self._update_status(msg, success=True)
+        self._update_progress(100)
+        # Masquer la barre après un court délai pour voir la complétion
+        self.app.after(1500, self._hide_progress_bar)
+
+    # === Game Stream Event (logs du jeu) ===
+    def _on_xml_stream(self, event):
+        # Log uniquement les événements importants (warnings/errors)
+        if event.level in ("WARN", "ERROR", "FATAL"):
+            logger.warning("GameLog [%s] %s: %s", event.level, event.logger, event.message)
+        # Info optionnel (décommentez si vous voulez tous les logs du jeu)
+        # else:
+        #     logger.debug("GameLog [%s] %s: %s", event.level, event.logger, event.message)
+
+    # Table de dispatch construite une fois au chargement de la classe
+    _DISPATCH = {
+        VersionLoadingEvent: _on_version_loading,
+        VersionFetchingEvent: _on_version_fetching,
+        VersionLoadedEvent: _on_version_loaded,
+        FeaturesEvent: _on_features,
+        JarFoundEvent: _on_jar_found,
+        AssetsResolveEvent: _on_assets_resolve,
+        LibrariesResolvingEvent: _on_libraries_resolving,
+        LibrariesResolvedEvent: _on_libraries_resolved,
+        LoggerFoundEvent: _on_logger_found,
+        JvmLoadingEvent: _on_jvm_loading,
+        JvmLoadedEvent: _on_jvm_loaded,
+        DownloadStartEvent: _on_download_start,
+        DownloadProgressEvent: _on_download_progress,
+        DownloadCompleteEvent: _on_download_complete,
+        XmlStreamEvent: _on_xml_stream,
+    }
     
+    def _tick(self):
+        """Applique la dernière progression connue aux widgets (thread Tk, ~10 Hz)."""
+        if not self._ticking:
+            return
+        with self._lock:
+            msg = self._latest_msg
+            progress = self._latest_progress
+        if msg and msg != self._last_shown_msg and self._status is not None:
+            self._status.configure(text=msg, text_color="#FF9800")
+            self._last_shown_msg = msg
+        if self._progress is not None and (
+            progress >= 100 or abs(progress - self._last_shown_progress) >= 0.5
+        ):
+            self._progress.set(progress / 100)
+            self._last_shown_progress = progress
+        self.app.after(100, self._tick)
+
     def _update_status(self, message, success=False, info=False, progress=False):
         """Met à jour le message de statut dans l'UI (thread-safe)."""
         def _do_update():
-            if hasattr(self.app, 'status_label'):
+            if self._status is not None:
                 # Choisir la couleur selon le type de message
                 if success:
                     color = "#4CAF50"  # Vert
@@ -252,7 +417,7 @@ class InstallWatcher(Watcher):
                 else:
                     color = "gray"  # Gris par défaut
                 
-                self.app.status_label.configure(text=message, text_color=color)
+                self._status.configure(text=message, text_color=color)
                 # update_idletasks non nécessaire si appelé via after
         
         self.app.after(0, _do_update)
@@ -260,34 +425,33 @@ class InstallWatcher(Watcher):
     def _update_progress(self, percent):
         """Met à jour la barre de progression (thread-safe)."""
         def _do_update():
-            if hasattr(self.app, 'progress_bar'):
-                self.app.progress_bar.set(percent / 100)
-        
+            if self._progress is not None:
+                self._progress.set(percent / 100)
+                self._last_shown_progress = percent
+
         self.app.after(0, _do_update)
     
     def _show_progress_bar(self):
         """Affiche la barre de progression (thread-safe)."""
         def _do_show():
-            if hasattr(self.app, 'progress_bar'):
-                self.app.progress_bar.pack(fill="x", padx=10, pady=5)
+            if self._progress is not None:
+                self._progress.pack(fill="x", padx=10, pady=5)
         
         self.app.after(0, _do_show)
     
     def _hide_progress_bar(self):
         """Masque la barre de progression (thread-safe)."""
         def _do_hide():
-            if hasattr(self.app, 'progress_bar'):
-                self.app.progress_bar.pack_forget()
+            if self._progress is not None:
+                self._progress.pack_forget()
         
         self.app.after(0, _do_hide)
     
     def _format_size(self, bytes_size):
         """Formate une taille en bytes en unités lisibles."""
-        for unit in ['o', 'Ko', 'Mo', 'Go']:
-            if bytes_size < 1024.0:
-                return f"{bytes_size:.1f} {unit}"
-            bytes_size /= 1024.0
-        return f"{bytes_size:.1f} To"
+        # Choix de l'unité via bit_length: pas de boucle de divisions
+        shift = min(max(0, (int(bytes_size).bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+        return f"{bytes_size / (1 << (shift * 10)):.1f} {_SIZE_UNITS[shift]}"
 
 class AdvancedSettingsWindow(ctk.CTkToplevel):
     """
@@ -347,6 +511,7 @@ class AdvancedSettingsWindow(ctk.CTkToplevel):
         
         # Charger les paramètres existants
         self.load_settings()
+        self._save_after_id = None
         self._setup_auto_save()
         self.after(50, self._fit_to_content)
     
@@ -428,19 +593,37 @@ class AdvancedSettingsWindow(ctk.CTkToplevel):
             self.quickplay_world,
         ]
         for widget in entries:
-            widget.bind("<KeyRelease>", lambda _evt: self.save_settings())
+            widget.bind("<KeyRelease>", self._schedule_save)
 
         # Le Text nécessite un handler dédié
         self.jvm_args.bind("<<Modified>>", self._on_jvm_modified)
-        
-        # Checkbox auto-save
+
+        # Checkbox auto-save (événement ponctuel: sauvegarde immédiate)
         self.auto_add_palgania.configure(command=self.save_settings)
 
+    def _schedule_save(self, _evt=None):
+        """Regrouper les frappes: une seule sauvegarde 300ms après la dernière"""
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(300, self._do_scheduled_save)
+
+    def _do_scheduled_save(self):
+        self._save_after_id = None
+        self.save_settings()
+
     def _on_jvm_modified(self, event):
         """Déclenche l'auto-save quand le texte JVM change"""
         if self.jvm_args.edit_modified():
             self.jvm_args.edit_modified(False)
+            self._schedule_save()
+
+    def destroy(self):
+        # Sauvegarder une éventuelle saisie en attente avant fermeture
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._save_after_id = None
             self.save_settings()
+        super().destroy()
 
     def _fit_to_content(self):
         """Adapter la taille de la fenêtre au contenu"""
@@ -467,9 +650,32 @@ class VersionSelectDialog(ctk.CTkToplevel):
         # Message de chargement
         self.loading_label = ctk.CTkLabel(self, text="Veuillez patienter…", font=("Arial", 12))
         self.loading_label.pack(padx=16, pady=(4, 8), anchor="w")
-        # Cadre scrollable
-        self.scroll = ctk.CTkScrollableFrame(self, width=420, height=320)
-        self.scroll.pack(padx=16, pady=8, fill="both", expand=True)
+        # Filtre texte (utile pour les milliers de snapshots)
+        self._all_versions = []
+        self.filter_entry = ctk.CTkEntry(self, placeholder_text="Filtrer…")
+        self.filter_entry.pack(padx=16, pady=(0, 4), fill="x")
+        self.filter_entry.bind("<KeyRelease>", self._apply_filter)
+        # Liste virtualisée: une seule Listbox au lieu d'un bouton par version,
+        # Tk ne rend que les lignes visibles (beaucoup plus léger pour les Snapshots)
+        list_frame = ctk.CTkFrame(self, width=420, height=320)
+        list_frame.pack(padx=16, pady=8, fill="both", expand=True)
+        try:
+            list_bg = self._apply_appearance_mode(ctk.ThemeManager.theme["CTkFrame"]["fg_color"])
+            list_fg = self._apply_appearance_mode(ctk.ThemeManager.theme["CTkLabel"]["text_color"])
+            select_bg = self._apply_appearance_mode(ctk.ThemeManager.theme["CTkButton"]["fg_color"])
+        except Exception:
+            list_bg, list_fg, select_bg = "#2b2b2b", "#f2f2f2", "#1f6aa5"
+        self.listbox = tk.Listbox(
+            list_frame, activestyle="dotbox", font=("Arial", 12),
+            borderwidth=0, highlightthickness=0,
+            bg=list_bg, fg=list_fg, selectbackground=select_bg,
+        )
+        scrollbar = ctk.CTkScrollbar(list_frame, command=self.listbox.yview)
+        self.listbox.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y", padx=(0, 4), pady=4)
+        self.listbox.pack(side="left", fill="both", expand=True, padx=(8, 0), pady=4)
+        self.listbox.bind("<Double-Button-1>", self._on_list_choice)
+        self.listbox.bind("<Return>", self._on_list_choice)
 
         # Remplir après un court délai pour laisser l'UI respirer
         self.after(100, lambda: self._populate(versions))
@@ -482,16 +688,32 @@ class VersionSelectDialog(ctk.CTkToplevel):
         self.after(50, self._fit)
 
     def _populate(self, versions):
-        for v in versions:
-            btn = ctk.CTkButton(self.scroll, text=v, width=360,
-                                command=lambda vv=v: self._choose_and_close(vv))
-            btn.pack(pady=4)
+        # Insertion en un seul appel: la Listbox rend les lignes à la demande
+        self._all_versions = list(versions)
+        if self._all_versions:
+            self.listbox.insert("end", *self._all_versions)
         # Retirer le message de chargement
         try:
             self.loading_label.pack_forget()
         except Exception:
             pass
 
+    def _apply_filter(self, _event=None):
+        """Ne montrer que les versions contenant le texte du filtre."""
+        needle = self.filter_entry.get().strip().lower()
+        if needle:
+            filtered = [v for v in self._all_versions if needle in v.lower()]
+        else:
+            filtered = self._all_versions
+        self.listbox.delete(0, "end")
+        if filtered:
+            self.listbox.insert("end", *filtered)
+
+    def _on_list_choice(self, event=None):
+        selection = self.listbox.curselection()
+        if selection:
+            self._choose_and_close(self.listbox.get(selection[0]))
+
     def _choose_and_close(self, value):
         # Sélectionner et fermer immédiatement
         self.selection = value
@@ -521,21 +743,33 @@ class App(ctk.CTk):
         super().__init__()
         self.title("Palgania's launcher")
         self.resizable(True, True)
-        self._set_window_icon()
-        
-        # Base de données d'authentification
+        # Décoder/redimensionner le logo sur un thread pendant que le reste
+        # de l'initialisation Tk se poursuit
+        self._ui_bootstrap = {}
+        bootstrap_thread = threading.Thread(target=self._prepare_ui_assets, daemon=True)
+        bootstrap_thread.start()
+
+        # Base de données d'authentification (chargée hors du thread UI)
         self.auth_db = AuthDatabase(pathlib.Path(AUTH_DATABASE_FILE))
-        self.auth_db.load()
         self.auth_session = None  # Session d'authentification active
+        self._persistent_loaded = False
         self.logged_email = ctk.StringVar(value="")  # Email du compte connecté
         
         # Variables
         self.online_mode = ctk.BooleanVar(value=True)
         self.loader = ctk.StringVar(value="Vanilla")
-        
-        # Load initial version groups for vanilla loader
-        self.version_groups = get_version_groups("vanilla")
-        
+        # _is_modded_loader mémoïsé: recalculé seulement quand le loader change
+        self._modded_cache = None
+        self.loader.trace_add("write", self._invalidate_modded_cache)
+        # Dernier triplet de mots-clés sauvegardé (anti-réécritures inutiles)
+        self._last_saved_assets = None
+        # Dernier nom de profil effectivement écrit dans LAST_PROFILE_FILE
+        self._last_saved_profile = None
+
+        # Versions vanilla depuis le cache local (ou fallback embarqué); le
+        # réseau est sollicité en arrière-plan une fois la fenêtre affichée
+        self._set_version_groups(get_cached_version_groups("vanilla"))
+
         # Choisir une famille et version par défaut depuis les groupes dynamiques
         default_group = next(iter(self.version_groups.keys()))
         default_versions = self.version_groups.get(default_group, ["1.21.2"])
@@ -546,12 +780,27 @@ class App(ctk.CTk):
         self.uuid = ctk.StringVar(value="")
         # Auto-save guard for assets text updates
         self._suspend_assets_autosave = False
-        # Champs pour packs/mods/shaders (mots-clés séparés par des virgules)
-        self.resource_packs_keywords = ctk.StringVar(value="")
-        self.mods_keywords = ctk.StringVar(value="")
-        self.shader_packs_keywords = ctk.StringVar(value="")
+        # Champs pour packs/mods/shaders (mots-clés séparés par des virgules).
+        # Jamais liés à un widget (les CTkTextbox n'acceptent pas de variable):
+        # de simples chaînes Python suffisent, sans variable Tcl
+        self.resource_packs_keywords = ""
+        self.mods_keywords = ""
+        self.shader_packs_keywords = ""
+        # Listes tokenisées une fois au changement, consommées au lancement
+        self._rp_list = ()
+        self._mods_list = ()
+        self._shaders_list = ()
         # État de la section extensible
         self.assets_section_expanded = False
+        # État de pack des sous-cadres, suivi côté Python pour éviter un
+        # aller-retour Tcl (winfo_manager) à chaque changement de loader
+        self._frame_packed = {"assets": False, "resource_packs": False,
+                              "mods": False, "shader": False}
+        # Ne refaire la passe de géométrie que si le contenu a changé
+        self._layout_dirty = True
+        # Vrai pendant un _ui_batch(): les update_idletasks intermédiaires
+        # sont différés jusqu'à la fin du lot
+        self._batching = False
         # Références UI pour la section extensible
         self.assets_toggle_btn = None
         self.assets_frame = None
@@ -575,29 +824,116 @@ class App(ctk.CTk):
             "auto_add_palgania": True
         }
         
-        self.profiles = self.load_profiles()
-        
+        # Profils vides le temps que le worker lise les fichiers JSON
+        self.profiles = {"Défaut": {}}
+        # Cache du parse de profiles.json, invalidé par (mtime, taille)
+        self._profiles_cache = None
+        # Mises à jour UI postées par les workers, vidées par trame (~60 Hz)
+        self._ui_pending = []
+        self._ui_latest_status = None
+        self._ui_flush_scheduled = False
+        self._ui_pending_lock = threading.Lock()
+        # Managers d'addons réutilisés entre lancements (index et caches chauds)
+        self._addons_managers = {}
+        self._addons_mgr_lock = threading.Lock()
+        # Cache du scan des versions Fabric installées, invalidé par mtime
+        self._fabric_scan_cache = {}
+        # Identifiants after() des callbacks clavier regroupés (anti-rafale)
+        self._debounce_ids = {}
+        # Pool partagé pour les tâches de fond ponctuelles: évite de créer
+        # un thread OS par clic et borne la concurrence
+        self._bg = ThreadPoolExecutor(max_workers=2, thread_name_prefix='bg')
+        atexit.register(self._bg.shutdown, wait=False)
+        # Sauvegardes auth regroupées et écrites par un thread dédié
+        # (boucle infinie: elle occuperait un slot du pool en permanence)
+        self._auth_save_q = queue.Queue()
+        threading.Thread(target=self._auth_save_worker, daemon=True).start()
+
+        # Récupérer les images préparées (délai court: simple redimensionnement)
+        bootstrap_thread.join(timeout=2)
+        self._set_window_icon()
         # Télécharger et afficher le logo
         self.setup_ui()
         self.after(50, self._fit_main_to_content)
+        # Lire auth et profils sur un thread pour ne pas retarder le premier affichage
+        self._submit_bg(self._load_persistent)
+        # Rafraîchir la liste des versions en arrière-plan et mettre à jour l'UI
+        self.after(0, self._refresh_versions_async)
+
+    def _set_version_groups(self, groups):
+        """Normaliser les groupes de versions: tuples immuables + noms pré-listés.
+
+        Les tuples peuvent être aliasés par configure(values=...) sans copie,
+        et la liste des familles n'est construite qu'une fois par mise à jour.
+        """
+        self.version_groups = {k: tuple(v) for k, v in groups.items()}
+        self._group_names = list(self.version_groups)
+        # Invalider l'empreinte: le prochain refresh repart d'une base sûre
+        self._version_groups_sig = None
+
+    def _auth_save_worker(self):
+        """Écrire la base d'authentification en différé, demandes regroupées."""
+        while True:
+            self._auth_save_q.get()
+            # Drainer les demandes accumulées: une seule écriture disque
+            try:
+                while True:
+                    self._auth_save_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.auth_db.save()
+            except Exception as e:
+                logger.warning("Sauvegarde de la base d'authentification échouée: %s", e)
+
+    def _request_auth_save(self):
+        """Demander une sauvegarde asynchrone de la base d'authentification."""
+        self._auth_save_q.put(None)
+
+    def _load_persistent(self):
+        """Charger auth et profils depuis le disque (thread de démarrage)."""
+        try:
+            self.auth_db.load()
+        except Exception as e:
+            logger.warning("Impossible de charger la base d'authentification: %s", e)
+        profiles = self.load_profiles()
+        # Retour sur le thread UI pour appliquer les données chargées
+        self.after(0, lambda: self._on_persistent_loaded(profiles))
+
+    def _on_persistent_loaded(self, profiles):
+        """Appliquer les données persistantes une fois chargées (thread UI)."""
+        self.profiles = profiles
+        self._persistent_loaded = True
+        try:
+            self.profile_combo.configure(values=list(self.profiles.keys()))
+        except Exception:
+            pass
         # Charger le dernier profil utilisé si ce n'est pas "Défaut"
         self._load_last_profile()
         # Connexion automatique au dernier compte utilisé
         self.after(100, self._auto_connect_last_account)
-        # Rafraîchir la liste des versions en arrière-plan et mettre à jour l'UI
-        self._refresh_versions_async()
         
-    def _set_window_icon(self):
-        """Définir l'icône de la fenêtre à partir du logo."""
+    def _prepare_ui_assets(self):
+        """Décoder et redimensionner le logo hors du thread UI (thread de démarrage)."""
         try:
             if os.path.exists(LOGO_FILE):
-                img = Image.open(LOGO_FILE)
-                icon = ImageTk.PhotoImage(img)
-                # Conserver une référence pour éviter la collecte
-                self._icon_image_ref = icon
-                self.iconphoto(False, icon)
+                with Image.open(LOGO_FILE) as img:
+                    # 32x32 suffit pour une icône de fenêtre
+                    self._ui_bootstrap["icon32"] = img.resize((32, 32), Image.Resampling.LANCZOS)
+                    self._ui_bootstrap["logo100"] = img.resize((100, 100), Image.Resampling.LANCZOS)
             else:
-                logger.warning("Logo introuvable pour l'icône: %s", LOGO_FILE)
+                logger.warning("Logo introuvable: %s", LOGO_FILE)
+        except Exception as exc:
+            logger.warning("Impossible de préparer le logo: %s", exc)
+
+    def _set_window_icon(self):
+        """Définir l'icône de la fenêtre à partir du logo préparé."""
+        try:
+            icon32 = self._ui_bootstrap.get("icon32")
+            if icon32 is not None:
+                # wm iconphoto prend un instantané des pixels: inutile de
+                # conserver la PhotoImage après l'appel
+                self.iconphoto(False, ImageTk.PhotoImage(icon32))
         except Exception as exc:
             logger.warning("Impossible de définir l'icône de fenêtre: %s", exc)
 
@@ -616,14 +952,14 @@ class App(ctk.CTk):
         logo_frame.pack(side="left", padx=(0, 20))
         
         try:
-            # Charger le logo local
-            if os.path.exists(LOGO_FILE):
-                image_data = Image.open(LOGO_FILE)
-                
-                # Redimensionner le logo
-                image_data = image_data.resize((100, 100), Image.Resampling.LANCZOS)
+            # Consommer le logo déjà décodé/redimensionné par le thread de démarrage
+            image_data = self._ui_bootstrap.get("logo100")
+            if image_data is None and os.path.exists(LOGO_FILE):
+                with Image.open(LOGO_FILE) as source:
+                    image_data = source.resize((100, 100), Image.Resampling.LANCZOS)
+            if image_data is not None:
                 self.logo_image = ctk.CTkImage(light_image=image_data, size=(100, 100))
-                
+
                 logo_label = ctk.CTkLabel(logo_frame, image=self.logo_image, text="")
                 logo_label.pack()
             else:
@@ -730,7 +1066,7 @@ class App(ctk.CTk):
         self.version_group_combo = ctk.CTkComboBox(
             version_subframe,
             variable=self.version_group,
-            values=list(self.version_groups.keys()),
+            values=self._group_names,
             state="readonly",
             width=180,
             command=self.on_version_group_change,
@@ -798,7 +1134,10 @@ class App(ctk.CTk):
         ctk.CTkLabel(profiles_subframe_new, text="Nouveau:", width=120, anchor="w").pack(side="left")
         self.new_profile_entry = ctk.CTkEntry(profiles_subframe_new, placeholder_text="Entrez un nouveau nom de profil", width=200)
         self.new_profile_entry.pack(side="left", padx=10)
-        self.new_profile_entry.bind("<KeyRelease>", lambda _e: self.update_profile_buttons())
+        # Rafraîchir l'état des boutons à la sortie du champ plutôt qu'à
+        # chaque frappe: aucun callback pendant la saisie
+        self.new_profile_entry.bind("<FocusOut>", lambda _e: self.update_profile_buttons())
+        self.new_profile_entry.bind("<Return>", lambda _e: self.update_profile_buttons())
         
         profiles_subframe2 = ctk.CTkFrame(profiles_frame)
         profiles_subframe2.pack(fill="x", padx=10, pady=5)
@@ -823,52 +1162,11 @@ class App(ctk.CTk):
         )
         self.assets_toggle_btn.pack(side="left")
 
-        # Conteneur extensible (non packé par défaut)
-        self.assets_frame = ctk.CTkFrame(assets_section)
-        # self.assets_frame.pack(fill="x", padx=10, pady=5)  # packé via toggle
-
-        # Texte d'explication
-        help_label = ctk.CTkLabel(
-            self.assets_frame,
-            text="💡 Séparez les add-ons par des virgules",
-            font=("Arial", 11),
-            text_color="gray"
-        )
-        help_label.pack(anchor="w", padx=10, pady=(5, 10))
-
-        # Champ Resource Packs (toujours affiché quand section étendue)
-        self.resource_packs_frame = ctk.CTkFrame(self.assets_frame)
-        ctk.CTkLabel(self.resource_packs_frame, text="Packs de ressources:", width=150, anchor="w").pack(anchor="w")
-        self.resource_packs_text = ctk.CTkTextbox(
-            self.resource_packs_frame,
-            width=350,
-            height=80,
-        )
-        self.resource_packs_text.pack(fill="x", expand=True, padx=10)
-        self.resource_packs_text.bind("<KeyRelease>", self._on_assets_text_change)
-
-        # Champ Mods (affiché uniquement pour loader moddé)
-        self.mods_frame = ctk.CTkFrame(self.assets_frame)
-        ctk.CTkLabel(self.mods_frame, text="Mods:", width=150, anchor="w").pack(anchor="w")
-        self.mods_text = ctk.CTkTextbox(
-            self.mods_frame,
-            width=350,
-            height=80,
-        )
-        self.mods_text.pack(fill="x", expand=True, padx=10)
-        self.mods_text.bind("<KeyRelease>", self._on_assets_text_change)
+        # Le contenu extensible (frames + textboxes) n'est construit qu'au
+        # premier dépliage: une dizaine de widgets CTk économisés au démarrage
+        self._assets_parent = assets_section
+        self._assets_built = False
 
-        # Champ Shader Packs (affiché uniquement pour loader moddé)
-        self.shader_frame = ctk.CTkFrame(self.assets_frame)
-        ctk.CTkLabel(self.shader_frame, text="Packs de shaders:", width=150, anchor="w").pack(anchor="w")
-        self.shader_text = ctk.CTkTextbox(
-            self.shader_frame,
-            width=350,
-            height=80,
-        )
-        self.shader_text.pack(fill="x", expand=True, padx=10)
-        self.shader_text.bind("<KeyRelease>", self._on_assets_text_change)
-        
         # Section 4: Statut et Progression
         status_section = ctk.CTkFrame(left_column)
         status_section.pack(fill="x", padx=10, pady=10)
@@ -918,6 +1216,10 @@ class App(ctk.CTk):
 
     def _fit_main_to_content(self):
         """Adapter la fenêtre principale au contenu"""
+        # update_idletasks + geometry coûtent une passe de layout complète:
+        # ne les refaire que si un widget a été ajouté/retiré depuis
+        if not self._layout_dirty:
+            return
         self.update_idletasks()
         padding_w = 40
         padding_h = 40
@@ -925,6 +1227,7 @@ class App(ctk.CTk):
         h = self.winfo_reqheight() + padding_h
         self.minsize(w, h)
         self.geometry(f"{w}x{h}")
+        self._layout_dirty = False
     
     def update_ui(self):
         """Mettre à jour l'UI en fonction du mode"""
@@ -964,58 +1267,67 @@ class App(ctk.CTk):
         if not email:
             return
         
-        # Vérifier si une session existe déjà
+        # Vérifier si une session existe déjà: validation/refresh sur un
+        # thread pour ne pas bloquer l'UI pendant l'aller-retour réseau
         existing_session = self.auth_db.get(email, MicrosoftAuthSession)
         if existing_session:
+            self._validate_session_async(
+                email, existing_session,
+                on_fail=lambda: self._authenticate_microsoft(email),
+            )
+            return
+
+        # Nouvelle authentification
+        self._authenticate_microsoft(email)
+
+    def _validate_session_async(self, email, session, on_fail=None):
+        """Valider (et au besoin rafraîchir) une session Microsoft hors du thread UI."""
+        def worker():
             try:
-                # Valider la session existante
-                if existing_session.validate():
-                    self.auth_session = existing_session
-                    self.logged_email.set(f"✓ Connecté: {email}")
-                    self.connect_btn.configure(text="Déconnexion")
-                    logger.info(f"Session validée pour {email}")
-                    self._save_last_account(email)  # Sauvegarder l'email
-                    return
-                else:
+                if not session.validate():
                     # Tenter de rafraîchir la session
-                    existing_session.refresh()
-                    self.auth_db.save()
-                    self.auth_session = existing_session
-                    self.logged_email.set(f"✓ Connecté: {email}")
-                    self.connect_btn.configure(text="Déconnexion")
-                    logger.info(f"Session rafraîchie pour {email}")
-                    self._save_last_account(email)  # Sauvegarder l'email
-                    return
+                    logger.info("Rafraîchissement de la session pour %s", email)
+                    session.refresh()
+                    self._request_auth_save()
+                self.after(0, lambda: self._on_auth_success(email, session))
             except AuthError as e:
-                logger.warning(f"Erreur lors de la validation: {e}")
-                # Continuer vers nouvelle authentification
-        
-        # Nouvelle authentification
-        self._authenticate_microsoft(email)
-    
+                logger.warning("Échec de validation de la session pour %s: %s", email, e)
+                if on_fail is not None:
+                    self.after(0, on_fail)
+
+        self._submit_bg(worker)
+
     def _authenticate_microsoft(self, email):
         """Authentification Microsoft via navigateur web"""
+        # Imports différés: uniquement nécessaires lors d'une authentification
+        import urllib.parse
+        import webbrowser
+
         nonce = uuid4().hex
-        app_id = MICROSOFT_AZURE_APP_ID
         # URL de redirection enregistrée dans l'App Azure du CLI portablemc
         redirect_uri = "https://www.theorozier.fr/portablemc/auth"
-        
-        # Générer l'URL d'authentification
-        auth_url = "https://login.live.com/oauth20_authorize.srf?{}".format(
-            urllib.parse.urlencode({
-                "client_id": app_id,
+
+        # Partie fixe de la query encodée une fois pour toutes; seuls
+        # login_hint et nonce varient d'un login à l'autre
+        global _AUTH_URL_FIXED
+        if _AUTH_URL_FIXED is None:
+            _AUTH_URL_FIXED = urllib.parse.urlencode({
+                "client_id": MICROSOFT_AZURE_APP_ID,
                 "redirect_uri": redirect_uri,
                 "response_type": "code id_token",
                 "scope": "xboxlive.signin offline_access openid email",
-                "login_hint": email,
-                "nonce": nonce,
                 "prompt": "select_account",
                 "response_mode": "fragment"
             })
+
+        # Générer l'URL d'authentification
+        auth_url = "https://login.live.com/oauth20_authorize.srf?{}&{}".format(
+            _AUTH_URL_FIXED,
+            urllib.parse.urlencode({"login_hint": email, "nonce": nonce}),
         )
         
         # Ouvrir le navigateur
-        logger.info(f"Ouverture de la page d'authentification pour {email}")
+        logger.info("Ouverture de la page d'authentification pour %s", email)
         webbrowser.open(auth_url)
         
         # Afficher un dialogue pour coller le code
@@ -1042,22 +1354,18 @@ class App(ctk.CTk):
             code = None
             id_token = None
             
-            if raw.startswith("http://") or raw.startswith("https://"):
+            if raw.startswith(("http://", "https://")):
                 parsed = urllib.parse.urlparse(raw)
-                # Essayer d'abord le fragment (response_mode=fragment)
-                params = urllib.parse.parse_qs(parsed.fragment)
-                # Si vide, tenter la query au cas où
-                if not params:
-                    params = urllib.parse.parse_qs(parsed.query)
-                code = (params.get("code") or [None])[0]
-                id_token = (params.get("id_token") or [None])[0]
+                # Essayer d'abord le fragment (response_mode=fragment),
+                # sinon la query; parse_qsl évite les listes intermédiaires
+                params = dict(urllib.parse.parse_qsl(parsed.fragment or parsed.query))
             else:
                 # Traiter comme un fragment ou une query brute 'id_token=...&code=...'
                 if raw.startswith("?"):
                     raw = raw[1:]
-                params = urllib.parse.parse_qs(raw)
-                code = (params.get("code") or [None])[0]
-                id_token = (params.get("id_token") or [None])[0]
+                params = dict(urllib.parse.parse_qsl(raw))
+            code = params.get("code")
+            id_token = params.get("id_token")
             
             if not code:
                 raise ValueError("Code d'authentification non trouvé")
@@ -1071,33 +1379,33 @@ class App(ctk.CTk):
             # Authentifier avec le code
             logger.info("Authentification en cours...")
             self.status_label.configure(text="Authentification en cours...", text_color="orange")
-            self.update_idletasks()
+            self._flush_idle()
             
             # Exécuter l'authentification dans un thread pour ne pas bloquer l'UI
             def auth_thread():
                 try:
                     session = MicrosoftAuthSession.authenticate(
                         self.auth_db.get_client_id(),
-                        app_id,
+                        MICROSOFT_AZURE_APP_ID,
                         code,
                         redirect_uri
                     )
                     
                     # Sauvegarder la session
                     self.auth_db.put(email, session)
-                    self.auth_db.save()
+                    self._request_auth_save()
                     
                     # Mettre à jour l'UI dans le thread principal
                     self.after(0, lambda: self._on_auth_success(email, session))
                     
                 except AuthError as e:
-                    logger.error(f"Erreur d'authentification: {e}")
+                    logger.error("Erreur d'authentification: %s", e)
                     self.after(0, lambda: self._on_auth_error(str(e)))
             
-            threading.Thread(target=auth_thread, daemon=True).start()
+            self._submit_bg(auth_thread)
             
         except Exception as e:
-            logger.error(f"Erreur lors du parsing de l'URL: {e}")
+            logger.error("Erreur lors du parsing de l'URL: %s", e)
             self.status_label.configure(
                 text=f"Erreur: {str(e)}",
                 text_color="red"
@@ -1112,7 +1420,7 @@ class App(ctk.CTk):
             text=f"Connecté en tant que {session.username}",
             text_color="#4CAF50"
         )
-        logger.info(f"Authentification réussie: {session.username} ({email})")
+        logger.info("Authentification réussie: %s (%s)", session.username, email)
         # Sauvegarder le dernier compte utilisé
         self._save_last_account(email)
     
@@ -1122,16 +1430,25 @@ class App(ctk.CTk):
             text=f"Erreur d'authentification: {error_msg}",
             text_color="red"
         )
-        logger.error(f"Erreur d'authentification: {error_msg}")
+        logger.error("Erreur d'authentification: %s", error_msg)
     
     def _save_last_account(self, email):
-        """Sauvegarder le dernier compte utilisé"""
+        """Sauvegarder le dernier compte utilisé (écriture atomique en arrière-plan)"""
+        # Éviter les écritures redondantes du même email
+        if email == getattr(self, '_last_written_account', None):
+            return
+        self._last_written_account = email
+        self._submit_bg(self._write_last_account_atomic, email)
+
+    def _write_last_account_atomic(self, email):
         try:
-            with open(LAST_ACCOUNT_FILE, 'w', encoding='utf-8') as f:
+            tmp_path = LAST_ACCOUNT_FILE + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 f.write(email)
-            logger.info(f"Dernier compte sauvegardé: {email}")
+            os.replace(tmp_path, LAST_ACCOUNT_FILE)
+            logger.info("Dernier compte sauvegardé: %s", email)
         except Exception as e:
-            logger.warning(f"Impossible de sauvegarder le dernier compte: {e}")
+            logger.warning("Impossible de sauvegarder le dernier compte: %s", e)
     
     def _load_last_account(self):
         """Charger le dernier compte utilisé"""
@@ -1140,7 +1457,7 @@ class App(ctk.CTk):
                 with open(LAST_ACCOUNT_FILE, 'r', encoding='utf-8') as f:
                     return f.read().strip()
         except Exception as e:
-            logger.warning(f"Impossible de charger le dernier compte: {e}")
+            logger.warning("Impossible de charger le dernier compte: %s", e)
         return None
     
     def _auto_connect_last_account(self):
@@ -1152,110 +1469,105 @@ class App(ctk.CTk):
         # Vérifier si une session existe pour ce compte
         existing_session = self.auth_db.get(email, MicrosoftAuthSession)
         if not existing_session:
-            logger.info(f"Aucune session trouvée pour {email}")
+            logger.info("Aucune session trouvée pour %s", email)
             return
         
-        try:
-            # Valider la session
-            if existing_session.validate():
-                self.auth_session = existing_session
-                self.logged_email.set(f"✓ Connecté: {email}")
-                self.connect_btn.configure(text="Déconnexion")
-                logger.info(f"Connexion automatique réussie pour {email}")
-            else:
-                # Tenter de rafraîchir la session
-                logger.info(f"Rafraîchissement de la session pour {email}")
-                existing_session.refresh()
-                self.auth_db.save()
-                self.auth_session = existing_session
-                self.logged_email.set(f"✓ Connecté: {email}")
-                self.connect_btn.configure(text="Déconnexion")
-                logger.info(f"Session rafraîchie automatiquement pour {email}")
-        except AuthError as e:
-            logger.warning(f"Échec de la connexion automatique pour {email}: {e}")
-            # Ne pas afficher d'erreur à l'utilisateur, juste ne pas se connecter
+        # Valider/rafraîchir hors du thread UI; en cas d'échec, ne rien
+        # afficher à l'utilisateur, juste ne pas se connecter
+        self._validate_session_async(email, existing_session)
 
     def _show_progress_bar(self):
         """Affiche la barre de progression."""
         if hasattr(self, 'progress_bar'):
             self.progress_bar.pack(fill="x", padx=10, pady=5)
-            self.update_idletasks()
+            self._flush_idle()
     
     def _hide_progress_bar(self):
         """Masque la barre de progression."""
         if hasattr(self, 'progress_bar'):
             self.progress_bar.pack_forget()
-            self.update_idletasks()
+            self._flush_idle()
     
     def _add_palgania_server(self, game_dir):
         """Ajoute Palgania à la liste des serveurs si absent"""
+        import struct  # import différé: utilisé uniquement pour le NBT
+        u16 = struct.Struct('>H')
+        i32 = struct.Struct('>i')
         try:
             servers_dat = os.path.join(game_dir, "servers.dat")
-            
-            # Structures NBT simplifiées
-            def read_nbt_string(f):
-                length = struct.unpack('>H', f.read(2))[0]
-                return f.read(length).decode('utf-8')
-            
-            def write_nbt_string(f, s):
+
+            # Structures NBT simplifiées, décodées depuis un buffer en mémoire
+            def read_nbt_string(buf, off):
+                (length,) = u16.unpack_from(buf, off)
+                end = off + 2 + length
+                return buf[off + 2:end].decode('utf-8'), end
+
+            def append_nbt_string(out, s):
                 encoded = s.encode('utf-8')
-                f.write(struct.pack('>H', len(encoded)))
-                f.write(encoded)
-            
+                out += u16.pack(len(encoded))
+                out += encoded
+
             servers = []
             has_palgania = False
-            
-            # Lire servers.dat existant
+
+            # Lire servers.dat existant (un seul read, parsing sans syscalls)
             if os.path.exists(servers_dat):
                 try:
                     with open(servers_dat, 'rb') as f:
-                        # TAG_Compound (type 10)
-                        tag_type = f.read(1)[0]
-                        if tag_type != 10:
-                            raise ValueError("Format NBT invalide")
-                        
-                        root_name = read_nbt_string(f)
-                        
-                        # Chercher TAG_List "servers" (type 9)
-                        while True:
-                            tag_type = f.read(1)
-                            if not tag_type or tag_type[0] == 0:  # TAG_End
-                                break
-                            
-                            tag_name = read_nbt_string(f)
-                            
-                            if tag_name == "servers" and tag_type[0] == 9:  # TAG_List
-                                list_type = f.read(1)[0]  # Type des éléments (10 = Compound)
-                                list_length = struct.unpack('>i', f.read(4))[0]
-                                
-                                for _ in range(list_length):
-                                    server = {}
-                                    # Lire chaque serveur (TAG_Compound)
-                                    while True:
-                                        inner_type = f.read(1)
-                                        if not inner_type or inner_type[0] == 0:  # TAG_End
-                                            break
-                                        
-                                        inner_name = read_nbt_string(f)
-                                        
-                                        if inner_type[0] == 8:  # TAG_String
-                                            value = read_nbt_string(f)
-                                            server[inner_name] = value
-                                            if inner_name == "ip" and value == "palgania.ovh":
-                                                has_palgania = True
-                                        elif inner_type[0] == 1:  # TAG_Byte
-                                            server[inner_name] = f.read(1)[0]
-                                        else:
-                                            # Ignorer les autres types
-                                            break
-                                    
-                                    servers.append(server)
-                                break
-                            else:
-                                # Ignorer ce tag
-                                break
+                        buf = f.read()
+                    off = 0
+                    # TAG_Compound (type 10)
+                    if buf[off] != 10:
+                        raise ValueError("Format NBT invalide")
+                    off += 1
+
+                    root_name, off = read_nbt_string(buf, off)
+
+                    # Chercher TAG_List "servers" (type 9)
+                    while off < len(buf):
+                        tag_type = buf[off]
+                        off += 1
+                        if tag_type == 0:  # TAG_End
+                            break
+
+                        tag_name, off = read_nbt_string(buf, off)
+
+                        if tag_name == "servers" and tag_type == 9:  # TAG_List
+                            list_type = buf[off]  # Type des éléments (10 = Compound)
+                            off += 1
+                            (list_length,) = i32.unpack_from(buf, off)
+                            off += 4
+
+                            for _ in range(list_length):
+                                server = {}
+                                # Lire chaque serveur (TAG_Compound)
+                                while off < len(buf):
+                                    inner_type = buf[off]
+                                    off += 1
+                                    if inner_type == 0:  # TAG_End
+                                        break
+
+                                    inner_name, off = read_nbt_string(buf, off)
+
+                                    if inner_type == 8:  # TAG_String
+                                        value, off = read_nbt_string(buf, off)
+                                        server[inner_name] = value
+                                        if inner_name == "ip" and value == "palgania.ovh":
+                                            has_palgania = True
+                                    elif inner_type == 1:  # TAG_Byte
+                                        server[inner_name] = buf[off]
+                                        off += 1
+                                    else:
+                                        # Ignorer les autres types
+                                        break
+
+                                servers.append(server)
+                            break
+                        else:
+                            # Ignorer ce tag
+                            break
                 except Exception as e:
-                    logger.warning(f"Impossible de lire servers.dat: {e}")
+                    logger.warning("Impossible de lire servers.dat: %s", e)
                     servers = []
             
             # Ajouter Palgania si absent
@@ -1267,46 +1579,45 @@ class App(ctk.CTk):
                 })
                 logger.info("Ajout de Palgania à la liste des serveurs")
                 
-                # Écrire le nouveau servers.dat
+                # Construire le nouveau servers.dat en mémoire, une seule écriture
+                out = bytearray()
+                # TAG_Compound root
+                out.append(10)
+                append_nbt_string(out, "")  # Nom vide
+
+                # TAG_List "servers" (en-tête précalculé)
+                out += _NBT_LIST_SERVERS
+                out.append(10)  # Type liste = Compound
+                out += i32.pack(len(servers))  # Nombre d'éléments
+
+                # Écrire chaque serveur
+                for server in servers:
+                    # TAG_String "name"
+                    out += _NBT_STR_NAME
+                    append_nbt_string(out, server.get("name", "Serveur"))
+
+                    # TAG_String "ip"
+                    out += _NBT_STR_IP
+                    append_nbt_string(out, server.get("ip", ""))
+
+                    # TAG_Byte "acceptTextures" (optionnel)
+                    if "acceptTextures" in server:
+                        out += _NBT_BYTE_ACCEPT_TEXTURES
+                        out.append(server["acceptTextures"])
+
+                    # TAG_End du serveur
+                    out.append(0)
+
+                # TAG_End du root
+                out.append(0)
+
                 with open(servers_dat, 'wb') as f:
-                    # TAG_Compound root
-                    f.write(b'\x0a')  # Type 10
-                    write_nbt_string(f, "")  # Nom vide
-                    
-                    # TAG_List "servers"
-                    f.write(b'\x09')  # Type 9
-                    write_nbt_string(f, "servers")
-                    f.write(b'\x0a')  # Type liste = Compound
-                    f.write(struct.pack('>i', len(servers)))  # Nombre d'éléments
-                    
-                    # Écrire chaque serveur
-                    for server in servers:
-                        # TAG_String "name"
-                        f.write(b'\x08')
-                        write_nbt_string(f, "name")
-                        write_nbt_string(f, server.get("name", "Serveur"))
-                        
-                        # TAG_String "ip"
-                        f.write(b'\x08')
-                        write_nbt_string(f, "ip")
-                        write_nbt_string(f, server.get("ip", ""))
-                        
-                        # TAG_Byte "acceptTextures" (optionnel)
-                        if "acceptTextures" in server:
-                            f.write(b'\x01')
-                            write_nbt_string(f, "acceptTextures")
-                            f.write(bytes([server["acceptTextures"]]))
-                        
-                        # TAG_End du serveur
-                        f.write(b'\x00')
-                    
-                    # TAG_End du root
-                    f.write(b'\x00')
+                    f.write(out)
             else:
                 logger.info("Palgania déjà présent dans la liste des serveurs")
                 
         except Exception as e:
-            logger.error(f"Erreur lors de l'ajout de Palgania: {e}")
+            logger.error("Erreur lors de l'ajout de Palgania: %s", e)
 
     def _find_installed_fabric_version_id(self, game_dir: str, mc_version: str) -> Optional[str]:
         """Recherche une version Fabric déjà installée correspondant à la version Minecraft.
@@ -1320,46 +1631,82 @@ class App(ctk.CTk):
             versions_dir = os.path.join(game_dir, "versions")
             if not os.path.isdir(versions_dir):
                 return None
-            for name in os.listdir(versions_dir):
-                vdir = os.path.join(versions_dir, name)
-                json_path = os.path.join(vdir, f"{name}.json")
-                if not os.path.isfile(json_path):
+            # Le dossier versions change rarement: le scan (stat + JSON par
+            # version installée) est mis en cache tant que son mtime est stable
+            st = os.stat(versions_dir)
+            key = (versions_dir, st.st_mtime_ns)
+            entries = self._fabric_scan_cache.get(key)
+            if entries is None:
+                entries = self._scan_fabric_versions(versions_dir)
+                self._fabric_scan_cache = {key: entries}
+            target = str(mc_version)
+            for name, inherits, version_id in entries:
+                # Correspondance par héritage exact ou présence de la version MC dans l'id
+                if (inherits and inherits == target) or (target in version_id):
+                    return name
+        except Exception as e:
+            logger.warning("Recherche Fabric locale échouée: %s", e)
+        return None
+
+    @staticmethod
+    def _scan_fabric_versions(versions_dir: str):
+        """Inventorier les versions Fabric installées: [(nom, inheritsFrom, id), ...]."""
+        entries = []
+        with os.scandir(versions_dir) as it:
+            for entry in it:
+                json_path = os.path.join(entry.path, f"{entry.name}.json")
+                try:
+                    with open(json_path, 'rb') as f:
+                        raw = f.read()
+                except OSError:
+                    continue
+                # Court-circuit au niveau octets avant tout parsing JSON
+                if b"net.fabricmc:fabric-loader" not in raw:
                     continue
                 try:
-                    with open(json_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
+                    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 except Exception:
                     continue
                 libs = data.get("libraries", [])
-                is_fabric = any("net.fabricmc:fabric-loader" in (lib.get("name") or "") for lib in libs)
-                if not is_fabric:
+                if not any("net.fabricmc:fabric-loader" in (lib.get("name") or "") for lib in libs):
                     continue
                 inherits = data.get("inheritsFrom") or data.get("inherits_from")
-                version_id = str(data.get("id") or name)
-                # Correspondance par héritage exact ou présence de la version MC dans l'id
-                if (inherits and str(inherits) == str(mc_version)) or (str(mc_version) in version_id):
-                    return name
-        except Exception as e:
-            logger.warning(f"Recherche Fabric locale échouée: {e}")
-        return None
+                entries.append((
+                    entry.name,
+                    str(inherits) if inherits else None,
+                    str(data.get("id") or entry.name),
+                ))
+        return entries
 
     def play_game(self):
         """Lancer le jeu avec les options choisies (démarre un thread pour ne pas bloquer l'UI)"""
+        # Appliquer les autosauvegardes encore en attente avant de lire l'état
+        self._flush_debounced()
         # Désactiver le bouton pour éviter les clics multiples
         self.play_btn.configure(state="disabled", fg_color="gray")
-        
-        # Démarrer le processus complet dans un thread séparé
-        threading.Thread(target=self._launch_game_task, daemon=True).start()
+
+        # Démarrer le processus complet sur le pool de fond
+        self._submit_bg(self._launch_game_task)
 
     def _launch_game_task(self):
         """Tâche de fond: téléchargement, installation et lancement du jeu"""
+        # Import différé: seulement nécessaire au lancement effectif
+        import urllib.error
+        # Instantané des variables Tk à l'entrée: un seul aller-retour Tcl
+        # chacune, et l'état ne peut plus changer sous le thread si
+        # l'utilisateur modifie les champs pendant le lancement
+        online = self.online_mode.get()
+        pseudo = self.pseudo.get()
+        uuid_val = self.uuid.get()
+        loader_val = self.loader.get()
+        version_val = self.version.get()
         print(f"Lancement du jeu avec les options:")
-        print(f"  Mode en ligne: {self.online_mode.get()}")
-        if not self.online_mode.get():
-            print(f"  Pseudo: {self.pseudo.get()}")
-            print(f"  UUID: {self.uuid.get()}")
-        print(f"  Loader: {self.loader.get()}")
-        print(f"  Version: {self.version.get()} ({self.version_group.get()})")
+        print(f"  Mode en ligne: {online}")
+        if not online:
+            print(f"  Pseudo: {pseudo}")
+            print(f"  UUID: {uuid_val}")
+        print(f"  Loader: {loader_val}")
+        print(f"  Version: {version_val} ({self.version_group.get()})")
         print(f"  Profil: {self.profile_name.get()}")
 
         try:
@@ -1383,10 +1730,8 @@ class App(ctk.CTk):
                 self.app_safe_ui_update(lambda: self.play_btn.configure(state="normal", fg_color="#4CAF50"))
                 return
 
-            # Préparer la version
-            loader_val = self.loader.get()
-            version_val = self.version.get()
-            
+            # Préparer la version (valeurs snapshotées à l'entrée)
+
             if loader_val == "Vanilla":
                 version = Version(version_val, context=context)
             elif loader_val == "Fabric":
@@ -1410,7 +1755,7 @@ class App(ctk.CTk):
                                 f"Version Minecraft: {version_val}\n\n"
                                 "Astuce: lancez une fois en ligne pour installer Fabric pour cette version."
                             )
-                            logger.error(f"Fabric init failed offline: {e}")
+                            logger.error("Fabric init failed offline: %s", e)
                             self.app_safe_ui_update(lambda: self.status_label.configure(text=msg, text_color="red"))
                             watcher = InstallWatcher(self) # Juste pour avoir accès aux méthodes hide thread-safe si besoin
                             watcher._hide_progress_bar()
@@ -1432,7 +1777,7 @@ class App(ctk.CTk):
                 if os.path.isfile(resolved_java):
                     version.jvm_path = pathlib.Path(resolved_java)
                     java_applied = True
-                    logger.info(f"Java personnalisé défini: {resolved_java}")
+                    logger.info("Java personnalisé défini: %s", resolved_java)
                 else:
                     warn = f"Chemin Java introuvable, Java par défaut utilisé: {resolved_java}"
                     logger.warning(warn)
@@ -1441,31 +1786,22 @@ class App(ctk.CTk):
             custom_jvm_args_raw = (self.advanced_settings.get("jvm_args", "") or "").strip()
             custom_jvm_args = []
             if custom_jvm_args_raw:
-                try:
-                    custom_jvm_args = shlex.split(custom_jvm_args_raw)
-                except ValueError:
-                    custom_jvm_args = custom_jvm_args_raw.split()
-                logger.info(f"Arguments JVM personnalisés saisis: {custom_jvm_args}")
+                custom_jvm_args = list(_split_jvm_args(custom_jvm_args_raw))
+                logger.info("Arguments JVM personnalisés saisis: %s", custom_jvm_args)
             
             # Configurer l'authentification
-            if self.online_mode.get():
+            if online:
                 # Mode en ligne: utiliser la session Microsoft si disponible
                 if self.auth_session:
                     version.auth_session = self.auth_session
-                    logger.info(f"Lancement avec authentification: {self.auth_session.username}")
+                    logger.info("Lancement avec authentification: %s", self.auth_session.username)
                 else:
                     logger.warning("Mode en ligne activé mais aucune session - lancement en mode hors ligne")
-                    version.set_auth_offline(
-                        self.pseudo.get() or None,
-                        self.uuid.get() or None
-                    )
+                    version.set_auth_offline(pseudo or None, uuid_val or None)
             else:
                 # Mode hors ligne: utiliser pseudo/UUID
-                version.set_auth_offline(
-                    self.pseudo.get() or None,
-                    self.uuid.get() or None
-                )
-                logger.info(f"Lancement en mode hors ligne: {self.pseudo.get() or 'pseudo aléatoire'}")
+                version.set_auth_offline(pseudo or None, uuid_val or None)
+                logger.info("Lancement en mode hors ligne: %s", pseudo or 'pseudo aléatoire')
             
             watcher = InstallWatcher(self)
             
@@ -1490,7 +1826,7 @@ class App(ctk.CTk):
                     error_msg += "• Un problème avec portablemc\n\n"
                     error_msg += f"Détails: {str(e)}"
                 
-                logger.error(f"Installation error for {loader_name} {version_name}: {e}")
+                logger.error("Installation error for %s %s: %s", loader_name, version_name, e)
                 self.app_safe_ui_update(lambda: self.status_label.configure(text=error_msg, text_color="red"))
                 watcher._hide_progress_bar()
                 self.app_safe_ui_update(lambda: self.play_btn.configure(state="normal", fg_color="#4CAF50"))
@@ -1498,7 +1834,7 @@ class App(ctk.CTk):
             except Exception as e:
                 # Autres erreurs d'installation
                 error_msg = f"❌ Erreur lors de l'installation:\n{type(e).__name__}: {str(e)[:100]}"
-                logger.error(f"Installation error: {e}", exc_info=True)
+                logger.error("Installation error: %s", e, exc_info=True)
                 self.app_safe_ui_update(lambda: self.status_label.configure(text=error_msg, text_color="red"))
                 watcher._hide_progress_bar()
                 self.app_safe_ui_update(lambda: self.play_btn.configure(state="normal", fg_color="#4CAF50"))
@@ -1508,10 +1844,12 @@ class App(ctk.CTk):
             if java_applied and resolved_java:
                 env.jvm_args[0] = resolved_java
             if custom_jvm_args:
-                env.jvm_args = env.jvm_args[:1] + custom_jvm_args + env.jvm_args[1:]
-            logger.info(f"JVM utilisée: {env.jvm_args[0]}")
+                # Insertion en place après le binaire java: pas de copie des
+                # trois tranches comme avec une concaténation
+                env.jvm_args[1:1] = custom_jvm_args
+            logger.info("JVM utilisée: %s", env.jvm_args[0])
             if custom_jvm_args:
-                logger.info(f"JVM args finaux: {env.jvm_args}")
+                logger.info("JVM args finaux: %s", env.jvm_args)
 
             # Ajouter Palgania à la liste des serveurs si demandé
             if self.advanced_settings.get("auto_add_palgania", True):
@@ -1524,31 +1862,19 @@ class App(ctk.CTk):
             
             if quickplay_server:
                 # Connexion à un serveur multijoueur
-                host = quickplay_server
-                port = quickplay_port or "25565"
                 # Normaliser et extraire host/port si saisi au format host:port ou avec schéma
-                try:
-                    s = host
-                    if "://" in s:
-                        s = s.split("://", 1)[1]
-                    if s.startswith("[") and "]:" in s:
-                        h, p = s.split("]:", 1)
-                        host = h.strip("[]")
-                        port = p
-                    elif ":" in s:
-                        parts = s.rsplit(":", 1)
-                        host = parts[0]
-                        port = parts[1]
-                    else:
-                        host = s
-                except Exception:
-                    host = quickplay_server
+                m = _ADDR_RE.match(quickplay_server)
+                if m:
+                    host = m.group('h6') or m.group('h')
+                    port = m.group('p6') or m.group('p') or quickplay_port or "25565"
+                else:
+                    # Entrée mal formée ("host:", "host:abc"...): retirer le
+                    # segment de port résiduel comme le faisait le split(":")
+                    host = quickplay_server.rsplit(':', 1)[0] or quickplay_server
+                    port = quickplay_port or "25565"
 
-                try:
-                    port_int = int(str(port))
-                    if not (1 <= port_int <= 65535):
-                        port_int = 25565
-                except Exception:
+                port_int = int(port) if port.isdigit() else 25565
+                if not (1 <= port_int <= 65535):
                     port_int = 25565
                 port = str(port_int)
 
@@ -1559,31 +1885,132 @@ class App(ctk.CTk):
                 env.game_args.extend(["--server", host])
                 if port != "25565":
                     env.game_args.extend(["--port", port])
-                logger.info(f"Quickplay: connexion au serveur {addr}")
+                logger.info("Quickplay: connexion au serveur %s", addr)
             elif quickplay_world:
                 # Lancement d'un monde solo
                 env.game_args.extend(["--quickPlaySingleplayer", quickplay_world])
-                logger.info(f"Quickplay: lancement du monde solo '{quickplay_world}'")
+                logger.info("Quickplay: lancement du monde solo '%s'", quickplay_world)
             
             # Masquer le launcher avant de lancer le jeu
             self.app_safe_ui_update(self.withdraw)
-            
-            # Lancer le jeu (bloque le thread jusqu'à la fin du jeu)
-            env.run()
-            
+
+            # Lancer la JVM détachée plutôt que via env.run(): run() garde le
+            # processus Python (Tk + tas CPython) résident pendant toute la
+            # session de jeu alors qu'il ne sert plus à rien. On reconstruit
+            # l'argv final avec les mêmes substitutions ${var} que portablemc
+            # et on laisse le jeu orphelin pour quitter immédiatement.
+            # Exception: les versions avec bibliothèques natives (≤1.18,
+            # Alpha/Beta) exigent l'extraction du répertoire bin/ et le
+            # remplacement de ${natives_directory}, que seul run() effectue;
+            # pour celles-ci on garde le comportement bloquant historique.
+            if getattr(env, "native_libs", None):
+                logger.info("Natives à extraire, lancement via env.run()")
+                env.run()
+            else:
+                try:
+                    import subprocess
+                    repl = env.args_replacements
+
+                    def resolve(args):
+                        return [
+                            re.sub(r"\$\{(\w+)\}", lambda m: repl.get(m.group(1), m.group(0)), a)
+                            for a in args
+                        ]
+
+                    argv = [*resolve(env.jvm_args), env.main_class, *resolve(env.game_args)]
+                    popen_kwargs = {"cwd": str(env.context.work_dir)}
+                    if os.name == "nt":
+                        popen_kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+                    else:
+                        popen_kwargs["start_new_session"] = True
+                    subprocess.Popen(argv, **popen_kwargs)
+                    logger.info("Jeu lancé en processus détaché, fermeture du launcher")
+                except Exception as run_e:
+                    # Repli: comportement historique bloquant jusqu'à la fin du jeu
+                    logger.warning("Lancement détaché impossible (%s), repli sur env.run()", run_e)
+                    env.run()
+
             # Fin du processus, on ferme l'appli python
-            # Note: sys.exit(0) ne tuerait que le thread, os._exit termine durement
+            # Note: sys.exit(0) ne tuerait que le thread, os._exit termine durement.
+            # Vider la file de logs avant, atexit ne s'exécutant pas ici.
+            _log_listener.stop()
             os._exit(0)
             
         except Exception as global_e:
-            logger.error(f"Fatal launch error: {global_e}", exc_info=True)
+            logger.error("Fatal launch error: %s", global_e, exc_info=True)
             _fatal_msg = f"Fatal Error: {global_e}"
             self.app_safe_ui_update(lambda msg=_fatal_msg: self.status_label.configure(text=msg, text_color="red"))
             self.app_safe_ui_update(lambda: self.play_btn.configure(state="normal", fg_color="#4CAF50"))
 
+    def _submit_bg(self, fn, *args):
+        """Soumettre une tâche ponctuelle au pool de fond partagé.
+
+        Contrairement à un thread daemon, une exception dans un future est
+        silencieuse: on la journalise via un done_callback.
+        """
+        future = self._bg.submit(fn, *args)
+        future.add_done_callback(_log_bg_exception)
+        return future
+
     def app_safe_ui_update(self, func):
         """Helper pour exécuter des mises à jour UI depuis un thread"""
-        self.after(0, func)
+        # Regrouper les callbacks par trame (~60 Hz): un seul réveil de la
+        # boucle Tk même si un worker poste des dizaines de mises à jour
+        with self._ui_pending_lock:
+            self._ui_pending.append(func)
+            if self._ui_flush_scheduled:
+                return
+            self._ui_flush_scheduled = True
+        self.after(16, self._flush_ui)
+
+    def app_safe_status_update(self, text, color="orange"):
+        """Mise à jour du label de statut depuis un thread (dernier écrit gagne)"""
+        with self._ui_pending_lock:
+            self._ui_latest_status = (text, color)
+            if self._ui_flush_scheduled:
+                return
+            self._ui_flush_scheduled = True
+        self.after(16, self._flush_ui)
+
+    def _ask_yes_no(self, title, message) -> bool:
+        """Poser une question oui/non utilisable depuis un thread de travail.
+
+        Sur le thread Tk, délègue directement à messagebox. Depuis un worker,
+        la boîte de dialogue est affichée sur le thread Tk via after(0) et
+        seul le worker attend la réponse: la boucle d'événements continue de
+        tourner (progressions, autres workers) pendant que l'utilisateur
+        réfléchit.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return messagebox.askyesno(title, message)
+        answered = threading.Event()
+        result = []
+
+        def ask():
+            try:
+                result.append(messagebox.askyesno(title, message))
+            finally:
+                answered.set()
+
+        self.after(0, ask)
+        answered.wait()
+        return bool(result and result[0])
+
+    def _flush_ui(self):
+        """Exécuter sur le thread UI tout ce qui a été posté depuis la dernière trame"""
+        with self._ui_pending_lock:
+            funcs = self._ui_pending
+            status = self._ui_latest_status
+            self._ui_pending = []
+            self._ui_latest_status = None
+            self._ui_flush_scheduled = False
+        for func in funcs:
+            try:
+                func()
+            except Exception as e:
+                logger.warning("Mise à jour UI échouée: %s", e)
+        if status is not None:
+            self.status_label.configure(text=status[0], text_color=status[1])
     
     def _prepare_all_addons_safe(self) -> bool:
         """Wrapper thread-safe pour _prepare_all_addons"""
@@ -1613,102 +2040,163 @@ class App(ctk.CTk):
          # Pas d'addons en Vanilla pur (sauf resource packs)
          # On va simplifier : on installe si des keywords sont présents
          
-         rp_keys = [k.strip() for k in self.resource_packs_keywords.get().split(',') if k.strip()]
-         mod_keys = [k.strip() for k in self.mods_keywords.get().split(',') if k.strip()]
-         sh_keys = [k.strip() for k in self.shader_packs_keywords.get().split(',') if k.strip()]
-         
-         total = len(rp_keys) + len(mod_keys) + len(sh_keys)
-         if total == 0:
-             return True
+         rp_keys = self._rp_list
+         mod_keys = self._mods_list
+         sh_keys = self._shaders_list
 
-         self.app_safe_ui_update(lambda: self.status_label.configure(text=f"Vérification des {total} addons...", text_color="orange"))
-         
          # Managers
          try:
              # Attention: AddonsManager utilise requests/urllib qui est bloquant (c'est ce qu'on veut ici)
              # Il faut juste ne pas toucher à l'UI
-             from addons_manager import AddonsManager, AddonNotFoundError
-             
              game_dir = self.advanced_settings.get("mc_data_dir", "") or None
-             
-             # Resource Packs
+
+             # Une tâche par catégorie: install_addons parallélise déjà ses
+             # téléchargements en interne et garantit le tout-ou-rien par
+             # dossier, donc les trois catégories peuvent tourner de front
+             tasks = []
              if rp_keys:
-                 mgr = AddonsManager("resourcepacks", game_dir=game_dir, loader=loader, version=version)
-                 try:
-                     self.app_safe_ui_update(lambda: self.status_label.configure(text="Installation des Resource Packs...", text_color="orange"))
-                     mgr.install_addons(rp_keys)
-                 except Exception as e:
-                     logger.error(f"Erreur RP: {e}")
-                     formatted = f"Erreur Resource Packs: {e}"
-                     self.app_safe_ui_update(lambda: messagebox.showerror("Erreur Addons", formatted))
-                     return False
-
-             # Mods (seulement si non vanilla)
+                 tasks.append(("Resource Packs", "resourcepacks", rp_keys))
+             # Mods seulement si non vanilla
              if mod_keys and loader != "vanilla":
-                 mgr = AddonsManager("mods", game_dir=game_dir, loader=loader, version=version)
-                 try:
-                     self.app_safe_ui_update(lambda: self.status_label.configure(text="Installation des Mods...", text_color="orange"))
-                     mgr.install_addons(mod_keys)
-                 except Exception as e:
-                     logger.error(f"Erreur Mods: {e}")
-                     _mods_err = f"Erreur Mods: {e}"
-                     self.app_safe_ui_update(lambda msg=_mods_err: messagebox.showerror("Erreur Addons", msg))
-                     return False
-             
-             # Shaders (seulement si Iris/Optifine présent, on suppose Iris sur Fabric/Neo)
+                 tasks.append(("Mods", "mods", mod_keys))
+             # Shaders (on suppose Iris sur Fabric/Neo)
              if sh_keys:
-                 # Force Iris loader handling in manager
-                 mgr = AddonsManager("shaderpacks", game_dir=game_dir, loader=loader, version=version)
+                 tasks.append(("Shaders", "shaderpacks", sh_keys))
+             if not tasks:
+                 return True
+
+             total = sum(len(keys) for _, _, keys in tasks)
+             self.app_safe_status_update(f"Vérification des {total} addons...")
+
+             # Empreintes des installations vérifiées récemment: une
+             # combinaison identique revérifiée il y a moins de 24h n'a pas
+             # besoin de repasser par le réseau
+             try:
+                 fp_cache = _read_json(ADDONS_CACHE_FILE)
+                 if not isinstance(fp_cache, dict):
+                     fp_cache = {}
+             except (OSError, ValueError):
+                 fp_cache = {}
+             now = time.time()
+             fp_lock = threading.Lock()
+             fp_installed = []
+
+             def install_category(addon_type, keys):
+                 h = _addons_fingerprint(addon_type, game_dir, loader, version, keys)
+                 if now - fp_cache.get(h, 0) < ADDONS_CACHE_TTL:
+                     logger.info("%s: vérifiés il y a moins de 24h, réseau sauté", addon_type)
+                     return
+                 # Réutiliser le manager d'un lancement précédent quand les
+                 # réglages n'ont pas bougé: ses index (compat, sha1) et la
+                 # session HTTP restent chauds
+                 key = (addon_type, game_dir, loader, version)
+                 with self._addons_mgr_lock:
+                     mgr = self._addons_managers.get(key)
+                     if mgr is None:
+                         mgr = AddonsManager(addon_type, game_dir=game_dir, loader=loader, version=version)
+                         self._addons_managers[key] = mgr
+                 mgr.install_addons(keys)
+                 with fp_lock:
+                     fp_cache[h] = now
+                     fp_installed.append(addon_type)
+
+             errors = []
+             done = 0
+             with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                 futures = {
+                     executor.submit(install_category, addon_type, keys): (label, len(keys))
+                     for label, addon_type, keys in tasks
+                 }
+                 for future in as_completed(futures):
+                     label, count = futures[future]
+                     try:
+                         future.result()
+                     except Exception as e:
+                         logger.error("Erreur %s: %s", label, e)
+                         errors.append(f"Erreur {label}: {e}")
+                         continue
+                     done += count
+                     self.app_safe_status_update(f"Addons prêts: {done}/{total}...")
+
+             if fp_installed:
+                 # Purger les empreintes expirées au passage
+                 fresh = {k: v for k, v in fp_cache.items() if now - v < ADDONS_CACHE_TTL}
                  try:
-                     self.app_safe_ui_update(lambda: self.status_label.configure(text="Installation des Shaders...", text_color="orange"))
-                     mgr.install_addons(sh_keys)
-                 except Exception as e:
-                     logger.error(f"Erreur Shaders: {e}")
-                     _shaders_err = f"Erreur Shaders: {e}"
-                     self.app_safe_ui_update(lambda msg=_shaders_err: messagebox.showerror("Erreur Addons", msg))
-                     return False
-                     
+                     _write_json(ADDONS_CACHE_FILE, fresh)
+                 except OSError as write_e:
+                     logger.warning("Écriture du cache addons impossible: %s", write_e)
+
+             if errors:
+                 _addons_err = "\n".join(errors)
+                 self.app_safe_ui_update(lambda msg=_addons_err: messagebox.showerror("Erreur Addons", msg))
+                 return False
+
              return True
-             
+
          except Exception as e:
-             logger.error(f"Erreur globale addons: {e}")
+             logger.error("Erreur globale addons: %s", e)
              _global_addons_err = f"Impossible de gérer les addons: {e}"
              self.app_safe_ui_update(lambda msg=_global_addons_err: messagebox.showerror("Erreur critique", msg))
              return False
 
     def load_profiles(self):
         """Charger les profils depuis le fichier JSON"""
-        if os.path.exists(PROFILES_FILE):
-            try:
-                with open(PROFILES_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Peut être un dict simple {profil_name: profil_data, ...}
-                    # ou un dict avec metadata: {"_metadata": {...}, profil_name: profil_data, ...}
-                    if isinstance(data, dict) and "_metadata" not in data:
-                        # Format ancien, juste les profils
-                        return data
-                    elif isinstance(data, dict):
-                        return data
-                    return {"Défaut": {}}
-            except:
-                return {"Défaut": {}}
-        return {"Défaut": {}}
-    
+        try:
+            st = os.stat(PROFILES_FILE)
+        except OSError:
+            return {"Défaut": {}}
+        # Mémoïsation sur (mtime, taille): relire/reparser seulement si le
+        # fichier a réellement changé depuis le dernier appel
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._profiles_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        try:
+            data = _read_json(PROFILES_FILE)
+            # Peut être un dict simple {profil_name: profil_data, ...}
+            # ou un dict avec metadata: {"_metadata": {...}, profil_name: profil_data, ...}
+            if not isinstance(data, dict):
+                data = {"Défaut": {}}
+        except (OSError, ValueError):
+            # ValueError couvre json.JSONDecodeError et orjson.JSONDecodeError
+            return {"Défaut": {}}
+        self._profiles_cache = (key, data)
+        return data
+
     def save_profiles(self):
         """Sauvegarder les profils dans le fichier JSON"""
-        with open(PROFILES_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.profiles, f, indent=2, ensure_ascii=False)
+        _write_json(PROFILES_FILE, self.profiles)
+        # Re-stat après écriture: le prochain load_profiles ne fera qu'un stat
+        try:
+            st = os.stat(PROFILES_FILE)
+            self._profiles_cache = ((st.st_mtime_ns, st.st_size), self.profiles)
+        except OSError:
+            self._profiles_cache = None
     
     def load_profile(self):
         """Charger un profil existant"""
+        with self._ui_batch():
+            self._load_profile_impl()
+
+    @staticmethod
+    def _set_if_diff(var, value):
+        """N'écrire une variable Tk que si la valeur change.
+
+        Chaque set() déclenche ses callbacks de trace (autosave, refresh...);
+        les éviter quand le profil chargé coïncide déjà avec l'UI.
+        """
+        if var.get() != value:
+            var.set(value)
+
+    def _load_profile_impl(self):
         profile_name = self.profile_name.get()
         if profile_name in self.profiles:
             profile_data = self.profiles[profile_name]
-            self.online_mode.set(profile_data.get("online_mode", True))
-            self.pseudo.set(profile_data.get("pseudo", ""))
-            self.uuid.set(profile_data.get("uuid", ""))
+            self._set_if_diff(self.online_mode, profile_data.get("online_mode", True))
+            self._set_if_diff(self.pseudo, profile_data.get("pseudo", ""))
+            self._set_if_diff(self.uuid, profile_data.get("uuid", ""))
             loaded_loader = profile_data.get("loader", "Vanilla")
-            self.loader.set(loaded_loader)
+            self._set_if_diff(self.loader, loaded_loader)
             # Rafraîchir immédiatement les familles/versions selon le loader du profil
             self.on_loader_change(loaded_loader)
             # Charger les champs de mots-clés (peuvent être absents sur anciens profils)
@@ -1721,21 +2209,21 @@ class App(ctk.CTk):
             saved_version = profile_data.get("version", "")
             if saved_version == "latest" or profile_name == "Défaut":
                 # Charger la toute dernière version disponible (famille + version)
-                families = list(self.version_groups.keys())
+                families = self._group_names
                 if families:
                     latest_family = families[0]
-                    self.version_group.set(latest_family)
+                    self._set_if_diff(self.version_group, latest_family)
                     versions = self.version_groups.get(latest_family, [])
                     self.update_version_options(latest_family)
                     if versions:
-                        self.version.set(versions[0])
+                        self._set_if_diff(self.version, versions[0])
                 else:
                     self.update_version_options()
             else:
                 # Charger la famille et la version stockées
-                self.version_group.set(profile_data.get("version_group", self.version_group.get()))
+                self._set_if_diff(self.version_group, profile_data.get("version_group", self.version_group.get()))
                 self.update_version_options()
-                self.version.set(saved_version)
+                self._set_if_diff(self.version, saved_version)
             
             # Charger les paramètres avancés
             if "advanced_settings" in profile_data:
@@ -1761,6 +2249,13 @@ class App(ctk.CTk):
     
     def save_profile(self):
         """Sauvegarder le profil actuel"""
+        with self._ui_batch():
+            self._save_profile_impl()
+
+    def _save_profile_impl(self):
+        # L'état des boutons n'est plus suivi frappe par frappe: le remettre
+        # à jour avant d'agir
+        self.update_profile_buttons()
         profile_name = self.new_profile_entry.get().strip()
         if not profile_name:
             profile_name = self.profile_name.get()
@@ -1810,6 +2305,7 @@ class App(ctk.CTk):
     
     def delete_profile(self):
         """Supprimer un profil"""
+        self.update_profile_buttons()
         profile_name = self.profile_name.get()
         if profile_name != "Défaut" and profile_name in self.profiles:
             del self.profiles[profile_name]
@@ -1825,15 +2321,19 @@ class App(ctk.CTk):
     
     def select_latest_version(self):
         """Sélectionner la dernière version disponible et marquer le profil comme 'latest'"""
+        with self._ui_batch():
+            self._select_latest_version_impl()
+
+    def _select_latest_version_impl(self):
         # Charger la dernière version
-        families = list(self.version_groups.keys())
+        families = self._group_names
         if families:
             latest_family = families[0]
-            self.version_group.set(latest_family)
+            self._set_if_diff(self.version_group, latest_family)
             versions = self.version_groups.get(latest_family, [])
             self.update_version_options(latest_family)
             if versions:
-                self.version.set(versions[0])
+                self._set_if_diff(self.version, versions[0])
         
         # Marquer le profil actuel avec version="latest" (sauf pour Défaut)
         profile_name = self.profile_name.get()
@@ -1842,7 +2342,53 @@ class App(ctk.CTk):
             self.profiles[profile_name]["version_group"] = self.version_group.get()
             self.save_profiles()
             print(f"Profil '{profile_name}' configuré pour utiliser toujours la dernière version")
-            logger.info(f"Profil '{profile_name}' marqué avec version='latest'")
+            logger.info("Profil '%s' marqué avec version='latest'", profile_name)
+
+    @contextmanager
+    def _ui_batch(self):
+        """Regrouper une séquence de mises à jour UI: un seul update_idletasks en sortie."""
+        if self._batching:
+            yield
+            return
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            self.update_idletasks()
+
+    def _flush_idle(self):
+        """update_idletasks, différé à la fin du lot si un _ui_batch est en cours."""
+        if not self._batching:
+            self.update_idletasks()
+
+    def _debounce(self, key, fn, delay=150):
+        """Regrouper une rafale d'événements: fn ne s'exécute qu'après `delay` ms de calme."""
+        pending = self._debounce_ids.pop(key, None)
+        if pending is not None:
+            self.after_cancel(pending[0])
+
+        def run():
+            self._debounce_ids.pop(key, None)
+            fn()
+
+        self._debounce_ids[key] = (self.after(delay, run), fn)
+
+    def _flush_debounced(self):
+        """Exécuter immédiatement tous les callbacks regroupés encore en attente."""
+        pending = list(self._debounce_ids.values())
+        self._debounce_ids.clear()
+        for after_id, fn in pending:
+            self.after_cancel(after_id)
+            fn()
+
+    def destroy(self):
+        # Vider les autosauvegardes en attente avant de fermer la fenêtre
+        try:
+            self._flush_debounced()
+        except Exception:
+            pass
+        super().destroy()
 
     def update_profile_buttons(self):
         """Activer/désactiver le bouton de sauvegarde selon le profil"""
@@ -1863,15 +2409,20 @@ class App(ctk.CTk):
             self.version_group.set(group)
         group_key = self.version_group.get()
         versions = self.version_groups.get(group_key, [])
-        self.version_combo.configure(values=versions if versions else [""])
+        # Les grandes familles (Snapshots, etc.) passent par le sélecteur
+        # filtrable: inutile de pousser des centaines de valeurs dans la
+        # combobox, dont l'ouverture devient très lente
+        use_dialog = group_key == "Snapshots" or len(versions) > 100
+        if not use_dialog:
+            self.version_combo.configure(values=versions if versions else [""])
         # Assurer que la version sélectionnée est valide pour ce groupe
         if versions:
             if self.version.get() not in versions:
                 self.version.set(versions[0])
         else:
             self.version.set("")
-        # Basculer vers un sélecteur scrollable pour Snapshots (meilleure ergonomie)
-        if group_key == "Snapshots":
+        # Basculer vers un sélecteur scrollable pour les longues listes
+        if use_dialog:
             # Afficher le bouton et masquer la combo pour éviter une liste trop grande
             self.version_select_btn.pack(side="left", padx=10)
             self.version_select_label.pack(side="left", padx=(5, 0))
@@ -1916,15 +2467,12 @@ class App(ctk.CTk):
         # Map UI label to internal loader name
         internal_loader = LOADER_MAP.get(value, "vanilla")
         
-        # Load versions for the selected loader
-        new_groups = get_version_groups(internal_loader)
-        if not new_groups:
-            new_groups = get_version_groups(internal_loader)  # Retry with fallback
-        
-        self.version_groups = new_groups
-        
+        # Versions depuis le cache disque (ou fallback embarqué), jamais le
+        # réseau: le rafraîchissement async ci-dessous revalide derrière
+        self._set_version_groups(get_cached_version_groups(internal_loader))
+
         # Update version group combo with new families
-        families = list(self.version_groups.keys())
+        families = self._group_names
         self.version_group_combo.configure(values=families)
         
         # Select first family
@@ -1944,8 +2492,8 @@ class App(ctk.CTk):
         if not groups:
             return
         # Update cache and UI if groups changed
-        self.version_groups = groups
-        families = list(self.version_groups.keys())
+        self._set_version_groups(groups)
+        families = self._group_names
         self.version_group_combo.configure(values=families)
         # Refresh current selection
         cur_family = self.version_group.get()
@@ -1953,27 +2501,40 @@ class App(ctk.CTk):
             self.update_version_options(cur_family)
 
     def _refresh_versions_async(self):
-        """Rafraîchir les versions en arrière-plan sans bloquer l'UI."""
-        import threading
+        """Rafraîchir les versions de tous les loaders en arrière-plan.
 
-        def worker():
-            new_groups = refresh_version_groups_async()
-            # Appliquer sur le thread UI
-            self.after(0, lambda: self._apply_new_version_groups(new_groups))
+        Un seul téléchargement du manifest pour les quatre loaders: les
+        changements de loader ultérieurs trouvent un cache déjà frais.
+        """
+        refresh_all_async(
+            lambda all_groups: self.after(0, lambda: self._on_versions_refreshed(all_groups)),
+        )
 
-        threading.Thread(target=worker, daemon=True).start()
+    def _on_versions_refreshed(self, all_groups):
+        """Appliquer à l'UI les groupes du loader affiché, si rafraîchis."""
+        internal_loader = LOADER_MAP.get(self.loader.get(), "vanilla")
+        groups = all_groups.get(internal_loader)
+        if groups:
+            self._apply_new_version_groups(groups)
 
     def _apply_new_version_groups(self, new_groups):
         """Mettre à jour les combobox si des nouvelles versions sont disponibles."""
         if not isinstance(new_groups, dict) or not new_groups:
             return
-        old_groups = self.version_groups
-        # Si identiques, ne rien faire
-        if old_groups == new_groups:
+        # Empreinte courte des groupes reçus: un refresh sans changement (le
+        # cas nominal) se compare en 20 octets, sans renormaliser le dict
+        sig = hashlib.sha1(
+            json.dumps(new_groups, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).digest()
+        if sig == self._version_groups_sig:
             return
-        self.version_groups = new_groups
+        self._version_groups_sig = sig
+        # Normaliser (les groupes en place sont des tuples)
+        normalized = {k: tuple(v) for k, v in new_groups.items()}
+        self.version_groups = normalized
+        self._group_names = list(normalized)
         # Mettre à jour la combo des familles
-        families = list(self.version_groups.keys())
+        families = self._group_names
         self.version_group_combo.configure(values=families)
         # Préserver sélection si possible
         cur_family = self.version_group.get()
@@ -1987,42 +2548,58 @@ class App(ctk.CTk):
             self.version.set(cur_version)
 
     def _set_assets_keywords_to_ui(self, resource_packs: str, mods: str, shaders: str):
-        """Définir le contenu des zones de texte des mots-clés et synchroniser les StringVars."""
+        """Définir le contenu des zones de texte des mots-clés et synchroniser les attributs."""
         prev = self._suspend_assets_autosave
         self._suspend_assets_autosave = True
-        # Mettre à jour les StringVars
-        self.resource_packs_keywords.set(resource_packs or "")
-        self.mods_keywords.set(mods or "")
-        self.shader_packs_keywords.set(shaders or "")
-        # Remplir les zones de texte si disponibles
-        if self.resource_packs_text:
-            self.resource_packs_text.delete("1.0", "end")
-            self.resource_packs_text.insert("1.0", self.resource_packs_keywords.get())
-        if self.mods_text:
-            self.mods_text.delete("1.0", "end")
-            self.mods_text.insert("1.0", self.mods_keywords.get())
-        if self.shader_text:
-            self.shader_text.delete("1.0", "end")
-            self.shader_text.insert("1.0", self.shader_packs_keywords.get())
+
+        def set_text(widget, value):
+            # Ne réécrire (et donc redessiner) que si le contenu change
+            if widget and widget.get("1.0", "end-1c") != value:
+                widget.delete("1.0", "end")
+                if value:
+                    widget.insert("1.0", value)
+
+        # Mettre à jour les attributs
+        self.resource_packs_keywords = resource_packs or ""
+        self.mods_keywords = mods or ""
+        self.shader_packs_keywords = shaders or ""
+        # Remplir les zones de texte si disponibles, en un seul lot d'affichage
+        with self._ui_batch():
+            set_text(self.resource_packs_text, self.resource_packs_keywords)
+            set_text(self.mods_text, self.mods_keywords)
+            set_text(self.shader_text, self.shader_packs_keywords)
+        self._retokenize_assets()
         self._suspend_assets_autosave = prev
 
     def _get_assets_keywords_from_ui(self):
-        """Récupérer le contenu des zones de texte des mots-clés et synchroniser les StringVars."""
-        resource = self.resource_packs_text.get("1.0", "end").strip() if self.resource_packs_text else self.resource_packs_keywords.get()
-        mods = self.mods_text.get("1.0", "end").strip() if self.mods_text else self.mods_keywords.get()
-        shaders = self.shader_text.get("1.0", "end").strip() if self.shader_text else self.shader_packs_keywords.get()
-        # Synchroniser les StringVars
-        self.resource_packs_keywords.set(resource)
-        self.mods_keywords.set(mods)
-        self.shader_packs_keywords.set(shaders)
+        """Récupérer le contenu des zones de texte des mots-clés et synchroniser les attributs."""
+        resource = self.resource_packs_text.get("1.0", "end").strip() if self.resource_packs_text else self.resource_packs_keywords
+        mods = self.mods_text.get("1.0", "end").strip() if self.mods_text else self.mods_keywords
+        shaders = self.shader_text.get("1.0", "end").strip() if self.shader_text else self.shader_packs_keywords
+        # Synchroniser les attributs
+        self.resource_packs_keywords = resource
+        self.mods_keywords = mods
+        self.shader_packs_keywords = shaders
+        self._retokenize_assets()
         return resource, mods, shaders
 
-    def _split_keywords(self, text: str):
-        """Découpe une chaîne en mots-clés par virgule ou retour ligne, en filtrant les vides."""
+    def _retokenize_assets(self):
+        """Retokeniser les mots-clés en listes, une fois par changement effectif."""
+        self._rp_list = self._split_keywords(self.resource_packs_keywords)
+        self._mods_list = self._split_keywords(self.mods_keywords)
+        self._shaders_list = self._split_keywords(self.shader_packs_keywords)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _split_keywords(text: str):
+        """Découpe une chaîne en mots-clés par virgule ou retour ligne, en filtrant les vides.
+
+        Résultat mémoïsé par chaîne: les mêmes réglages ne sont tokenisés qu'une fois.
+        """
         if not text:
-            return []
+            return ()
         raw = text.replace("\n", ",").split(",")
-        return [w.strip() for w in raw if w.strip()]
+        return tuple(w.strip() for w in raw if w.strip())
 
     def _prepare_addons_for_type(self, addon_type: str, keywords):
         """Préparer/fetch/installer les addons pour un type donné.
@@ -2048,78 +2625,70 @@ class App(ctk.CTk):
         )
 
         total = len(keywords)
-        # Afficher progression dans la zone de statut principale
-        self._show_progress_bar()
-        self.progress_bar.set(0)
-        self.status_label.configure(text=f"[Addons] {addon_type}: 0/{total}", text_color="#FF9800")
-        self.update_idletasks()
+        # Afficher progression dans la zone de statut principale.  Les mises à
+        # jour passent par les helpers coalescés (une trame Tk par lot) plutôt
+        # que par des update_idletasks forcés à chaque mot-clé.
+        self.app_safe_ui_update(self._show_progress_bar)
+        self.app_safe_ui_update(lambda: self.progress_bar.set(0))
+        self.app_safe_status_update(f"[Addons] {addon_type}: 0/{total}", "#FF9800")
         successful = []
-        for idx, kw in enumerate(keywords, 1):
-            self.status_label.configure(text=f"[Addons] {addon_type} {idx-1}/{total} | Vérification: {kw}", text_color="#FF9800")
-            if total:
-                self.progress_bar.set((idx-1)/total)
-            self.update_idletasks()
-            try:
-                # Fetch addon (will use local exact-compatible version if offline, otherwise download)
-                mgr.fetch_keyword(kw)
-                successful.append(kw)
-                status_msg = f"[Addons] {addon_type} {idx}/{total} | Addon: {kw}"
-                self.status_label.configure(text=status_msg, text_color="#FF9800")
-                if total:
-                    self.progress_bar.set(idx/total)
-                self.update_idletasks()
-            except AddonNotFoundError as e:
-                error_message = str(e)
-                # Message plus clair pour le mode hors ligne
-                if "pas d'accès internet" in error_message.lower():
-                    msg = (
-                        f"Mode hors ligne: '{kw}' n'est pas disponible localement\n"
-                        f"L'addon doit être téléchargé mais il n'y a pas de connexion.\n\n"
-                        f"Astuce: Lancez une fois avec une connexion internet pour\n"
-                        f"télécharger l'addon dans {addon_type}_available\n\n"
-                        "Continuer le lancement sans cet addon ?"
-                    )
-                else:
-                    msg = (
-                        f"Impossible de récupérer '{kw}' pour {addon_type}\n"
-                        f"{error_message}\n\n"
-                        "Continuer le lancement sans cet addon ?"
-                    )
-                if not messagebox.askyesno("Addon introuvable", msg):
-                    return False
-                # Avancer tout de même la progression
-                status_text = "Ignoré (hors ligne)" if "pas d'accès internet" in error_message.lower() else "Ignoré (introuvable)"
-                self.status_label.configure(text=f"[Addons] {addon_type} {idx}/{total} | {status_text}: {kw}", text_color="#FF9800")
-                if total:
-                    self.progress_bar.set(idx/total)
-                self.update_idletasks()
-            except Exception as e:
-                msg = (
-                    f"Erreur lors du téléchargement de '{kw}' ({addon_type})\n"
-                    f"{type(e).__name__}: {e}\n\n"
-                    "Continuer le lancement sans cet addon ?"
-                )
-                if not messagebox.askyesno("Erreur addon", msg):
-                    return False
-                self.status_label.configure(text=f"[Addons] {addon_type} {idx}/{total} | Erreur, ignoré: {kw}", text_color="#FF9800")
+        # Les échecs sont collectés et présentés en une seule question à la
+        # fin: un messagebox par mot-clé raté gelait tous les fetchs en cours
+        failures = []
+        # Les fetchs sont de l'attente réseau: tous soumis d'un coup au pool,
+        # la progression avance au fil des complétions plutôt qu'en série
+        executor = ThreadPoolExecutor(max_workers=min(8, total))
+        try:
+            futures = {executor.submit(mgr.fetch_keyword, kw): kw for kw in keywords}
+            for idx, future in enumerate(as_completed(futures), 1):
+                kw = futures[future]
+                try:
+                    # Fetch addon (will use local exact-compatible version if offline, otherwise download)
+                    future.result()
+                    successful.append(kw)
+                    status_msg = f"[Addons] {addon_type} {idx}/{total} | Addon: {kw}"
+                except AddonNotFoundError as e:
+                    error_message = str(e)
+                    # Message plus clair pour le mode hors ligne
+                    if "pas d'accès internet" in error_message.lower():
+                        failures.append(f"{kw} — hors ligne, absent du cache local")
+                        status_text = "Ignoré (hors ligne)"
+                    else:
+                        failures.append(f"{kw} — introuvable: {error_message}")
+                        status_text = "Ignoré (introuvable)"
+                    status_msg = f"[Addons] {addon_type} {idx}/{total} | {status_text}: {kw}"
+                except Exception as e:
+                    failures.append(f"{kw} — {type(e).__name__}: {e}")
+                    status_msg = f"[Addons] {addon_type} {idx}/{total} | Erreur, ignoré: {kw}"
+                self.app_safe_status_update(status_msg, "#FF9800")
                 if total:
-                    self.progress_bar.set(idx/total)
-                self.update_idletasks()
+                    self.app_safe_ui_update(lambda f=idx / total: self.progress_bar.set(f))
+        finally:
+            # En cas d'annulation, ne pas attendre les téléchargements restants
+            executor.shutdown(wait=False, cancel_futures=True)
+        if failures:
+            msg = (
+                f"{len(failures)} addon(s) {addon_type} n'ont pas pu être récupérés:\n\n"
+                + "\n".join(f"• {f}" for f in failures)
+                + "\n\nAstuce: lancez une fois avec une connexion internet pour\n"
+                f"télécharger les addons manquants dans {addon_type}_available\n\n"
+                "Continuer le lancement sans ces addons ?"
+            )
+            if not self._ask_yes_no("Addons manquants", msg):
+                return False
         if successful:
             try:
                 installed = mgr.install_addons(successful)
-                self.status_label.configure(text=f"[Addons] {addon_type} | Installés: {len(installed)} fichier(s)", text_color="#4CAF50")
-                self.update_idletasks()
+                self.app_safe_status_update(f"[Addons] {addon_type} | Installés: {len(installed)} fichier(s)", "#4CAF50")
             except Exception as e:
                 msg = (
                     f"Erreur lors de l'installation des addons {addon_type}\n"
                     f"{type(e).__name__}: {e}\n\n"
                     "Continuer le lancement sans ces addons ?"
                 )
-                if not messagebox.askyesno("Erreur installation addons", msg):
+                if not self._ask_yes_no("Erreur installation addons", msg):
                     return False
-                self.status_label.configure(text=f"[Addons] {addon_type} | Installation partielle/échouée", text_color="#FF9800")
-                self.update_idletasks()
+                self.app_safe_status_update(f"[Addons] {addon_type} | Installation partielle/échouée", "#FF9800")
         return True
 
     def _prepare_all_addons(self):
@@ -2127,10 +2696,10 @@ class App(ctk.CTk):
 
         Retourne True si on peut lancer, False si annulé par l'utilisateur.
         """
-        r_text, m_text, s_text = self._get_assets_keywords_from_ui()
-        r_list = self._split_keywords(r_text)
-        m_list = self._split_keywords(m_text) if self._is_modded_loader() else []
-        s_list = self._split_keywords(s_text) if self._is_modded_loader() else []
+        self._get_assets_keywords_from_ui()
+        r_list = self._rp_list
+        m_list = self._mods_list if self._is_modded_loader() else []
+        s_list = self._shaders_list if self._is_modded_loader() else []
 
         if not self._prepare_addons_for_type("resourcepacks", r_list):
             return False
@@ -2148,6 +2717,12 @@ class App(ctk.CTk):
         profile_name = self.profile_name.get()
         if profile_name == "Défaut" or profile_name not in self.profiles:
             return
+        # Ne pas réécrire le JSON si le triplet n'a pas changé depuis la
+        # dernière sauvegarde (frappes qui se neutralisent, focus perdus...)
+        triple = (r_kw, m_kw, s_kw)
+        if triple == self._last_saved_assets:
+            return
+        self._last_saved_assets = triple
         # Mettre à jour uniquement les champs concernés
         self.profiles[profile_name]["resource_packs_keywords"] = r_kw
         self.profiles[profile_name]["mods_keywords"] = m_kw
@@ -2156,26 +2731,115 @@ class App(ctk.CTk):
 
 
     def _is_modded_loader(self):
-        """Retourne True si le loader sélectionné est moddé (Fabric/Forge/Neoforge)."""
-        return self.loader.get() in ("Fabric", "Forge", "Neoforge")
+        """Retourne True si le loader sélectionné est moddé (Fabric/Forge/Neoforge).
+
+        Mémoïsé: invalidé par le trace_add posé sur la variable loader.
+        """
+        if self._modded_cache is None:
+            self._modded_cache = self.loader.get() in ("Fabric", "Forge", "Neoforge")
+        return self._modded_cache
+
+    def _invalidate_modded_cache(self, *_args):
+        self._modded_cache = None
+
+    def _build_assets_frame(self):
+        """Construire le contenu extensible de la section assets (au premier dépliage)."""
+        # Conteneur extensible (non packé par défaut)
+        self.assets_frame = ctk.CTkFrame(self._assets_parent)
+
+        # Texte d'explication
+        help_label = ctk.CTkLabel(
+            self.assets_frame,
+            text="💡 Séparez les add-ons par des virgules",
+            font=("Arial", 11),
+            text_color="gray"
+        )
+        help_label.pack(anchor="w", padx=10, pady=(5, 10))
+
+        # Champ Resource Packs (toujours affiché quand section étendue)
+        self.resource_packs_frame = ctk.CTkFrame(self.assets_frame)
+        ctk.CTkLabel(self.resource_packs_frame, text="Packs de ressources:", width=150, anchor="w").pack(anchor="w")
+        self.resource_packs_text = ctk.CTkTextbox(
+            self.resource_packs_frame,
+            width=350,
+            height=80,
+        )
+        self.resource_packs_text.pack(fill="x", expand=True, padx=10)
+        self.resource_packs_text.bind(
+            "<KeyRelease>",
+            lambda _e: self._debounce('assets_text', self._on_assets_text_change),
+        )
+
+        # Champ Mods (affiché uniquement pour loader moddé)
+        self.mods_frame = ctk.CTkFrame(self.assets_frame)
+        ctk.CTkLabel(self.mods_frame, text="Mods:", width=150, anchor="w").pack(anchor="w")
+        self.mods_text = ctk.CTkTextbox(
+            self.mods_frame,
+            width=350,
+            height=80,
+        )
+        self.mods_text.pack(fill="x", expand=True, padx=10)
+        self.mods_text.bind(
+            "<KeyRelease>",
+            lambda _e: self._debounce('assets_text', self._on_assets_text_change),
+        )
+
+        # Champ Shader Packs (affiché uniquement pour loader moddé)
+        self.shader_frame = ctk.CTkFrame(self.assets_frame)
+        ctk.CTkLabel(self.shader_frame, text="Packs de shaders:", width=150, anchor="w").pack(anchor="w")
+        self.shader_text = ctk.CTkTextbox(
+            self.shader_frame,
+            width=350,
+            height=80,
+        )
+        self.shader_text.pack(fill="x", expand=True, padx=10)
+        self.shader_text.bind(
+            "<KeyRelease>",
+            lambda _e: self._debounce('assets_text', self._on_assets_text_change),
+        )
+
+        self._assets_built = True
+        # Reporter dans les textboxes les mots-clés chargés avant construction
+        self._set_assets_keywords_to_ui(
+            self.resource_packs_keywords,
+            self.mods_keywords,
+            self.shader_packs_keywords,
+        )
+
+    def _pack_frame(self, key, frame):
+        """Pack un sous-cadre de la section assets en tenant le drapeau à jour."""
+        if not self._frame_packed[key]:
+            frame.pack(fill="x", padx=10, pady=5)
+            self._frame_packed[key] = True
+
+    def _unpack_frame(self, key, frame):
+        """Masquer un sous-cadre de la section assets en tenant le drapeau à jour."""
+        if self._frame_packed[key]:
+            frame.pack_forget()
+            self._frame_packed[key] = False
 
     def _toggle_assets_section(self):
         """Étendre ou rabattre la section des champs mods/resources/shaders."""
+        if not self._assets_built:
+            self._build_assets_frame()
         self.assets_section_expanded = not self.assets_section_expanded
         if self.assets_section_expanded:
             # Afficher le conteneur et les sous-champs selon le loader
-            self.assets_frame.pack(fill="x", padx=10, pady=5)
+            self._pack_frame("assets", self.assets_frame)
             # Pack les sous-champs dans l'ordre
-            self.resource_packs_frame.pack(fill="x", padx=10, pady=5)
+            self._pack_frame("resource_packs", self.resource_packs_frame)
             if self._is_modded_loader():
-                self.mods_frame.pack(fill="x", padx=10, pady=5)
-                self.shader_frame.pack(fill="x", padx=10, pady=5)
+                self._pack_frame("mods", self.mods_frame)
+                self._pack_frame("shader", self.shader_frame)
         else:
             # Masquer toute la section
-            self.shader_frame.pack_forget()
-            self.mods_frame.pack_forget()
-            self.resource_packs_frame.pack_forget()
-            self.assets_frame.pack_forget()
+            self._unpack_frame("shader", self.shader_frame)
+            self._unpack_frame("mods", self.mods_frame)
+            self._unpack_frame("resource_packs", self.resource_packs_frame)
+            self._unpack_frame("assets", self.assets_frame)
+        # Le contenu a grandi ou rétréci: réadapter la fenêtre
+        self._layout_dirty = True
+        self.after(50, self._fit_main_to_content)
 
     def _update_assets_fields_visibility(self):
         """Met à jour la visibilité des champs internes selon le loader et l'état étendu."""
@@ -2183,23 +2847,38 @@ class App(ctk.CTk):
         if not self.assets_section_expanded:
             return
         # Toujours afficher le champ packs de ressources lorsque étendue
-        if str(self.resource_packs_frame.winfo_manager()) == "":
-            self.resource_packs_frame.pack(fill="x", padx=10, pady=5)
+        self._pack_frame("resource_packs", self.resource_packs_frame)
         # Afficher/masquer mods et shaders selon le loader
         if self._is_modded_loader():
-            if str(self.mods_frame.winfo_manager()) == "":
-                self.mods_frame.pack(fill="x", padx=10, pady=5)
-            if str(self.shader_frame.winfo_manager()) == "":
-                self.shader_frame.pack(fill="x", padx=10, pady=5)
-        else:
-            self.mods_frame.pack_forget()
-            self.shader_frame.pack_forget()
+            self._pack_frame("mods", self.mods_frame)
+            if not self._frame_packed["shader"]:
+                self._pack_frame("shader", self.shader_frame)
+                self._layout_dirty = True
+        elif self._frame_packed["mods"] or self._frame_packed["shader"]:
+            self._unpack_frame("mods", self.mods_frame)
+            self._unpack_frame("shader", self.shader_frame)
+            self._layout_dirty = True
 
     def _save_last_profile(self, profile_name):
-        """Sauvegarder le nom du dernier profil utilisé dans un fichier dédié"""
+        """Sauvegarder le nom du dernier profil utilisé (différé et dédoublonné).
+
+        Les bascules rapides de profil se regroupent en une seule écriture via
+        _debounce (vidé à la fermeture), et rien n'est écrit si le nom n'a pas
+        changé depuis la dernière écriture. La comparaison se fait au moment
+        de l'écriture: toujours replanifier ici, pour qu'un aller-retour
+        A→B→A dans la fenêtre de debounce remplace bien l'écriture de B en
+        attente au lieu de la laisser partir.
+        """
+        self._debounce("last_profile", lambda: self._write_last_profile(profile_name), delay=250)
+
+    def _write_last_profile(self, profile_name):
+        """Écrire le nom du dernier profil utilisé dans un fichier dédié"""
+        if profile_name == self._last_saved_profile:
+            return
         try:
             with open(LAST_PROFILE_FILE, 'w', encoding='utf-8') as f:
                 f.write(profile_name)
+            self._last_saved_profile = profile_name
         except Exception as e:
             print(f"Erreur lors de la sauvegarde du dernier profil: {e}")
 
@@ -2228,25 +2907,26 @@ class App(ctk.CTk):
     def _load_default_latest(self):
         """Charger le profil Défaut en forçant la dernière version disponible."""
         profile_data = self.profiles.get("Défaut", {})
-        self.online_mode.set(profile_data.get("online_mode", True))
-        self.pseudo.set(profile_data.get("pseudo", ""))
-        self.uuid.set(profile_data.get("uuid", ""))
-        self.loader.set(profile_data.get("loader", "Vanilla"))
+        self._set_if_diff(self.online_mode, profile_data.get("online_mode", True))
+        self._set_if_diff(self.pseudo, profile_data.get("pseudo", ""))
+        self._set_if_diff(self.uuid, profile_data.get("uuid", ""))
+        self._set_if_diff(self.loader, profile_data.get("loader", "Vanilla"))
 
-        families = list(self.version_groups.keys())
+        families = self._group_names
         if families:
             latest_family = families[0]
-            self.version_group.set(latest_family)
+            self._set_if_diff(self.version_group, latest_family)
             versions = self.version_groups.get(latest_family, [])
             self.update_version_options(latest_family)
             if versions:
-                self.version.set(versions[0])
+                self._set_if_diff(self.version, versions[0])
         else:
             self.update_version_options()
 
         # Charger les paramètres avancés
         if "advanced_settings" in profile_data:
-            self.advanced_settings = profile_data["advanced_settings"]
+            if self.advanced_settings != profile_data["advanced_settings"]:
+                self.advanced_settings = profile_data["advanced_settings"]
         else:
             self.advanced_settings = {
                 "java_path": "",
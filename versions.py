@@ -1,9 +1,12 @@
+import gzip
 import json
 import os
-import urllib.request
+import requests
 import threading
 import re
 import xml.etree.ElementTree as ET
+from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 
@@ -40,8 +43,25 @@ def _get_config_dir() -> Path:
     return p
 
 def _cache_file_path() -> Path:
+    # Gzippé: les ids de versions sont très répétitifs (~10× plus petit)
+    return _get_config_dir() / "versions_cache.json.gz"
+
+
+def _legacy_cache_file_path() -> Path:
     return _get_config_dir() / "versions_cache.json"
 
+# Format snapshot: YYwWWx (ex: 24w45a) — compilé une fois au chargement
+_SNAPSHOT_RE = re.compile(r'^(\d{2})w(\d{2})([a-z])$')
+
+# Session HTTP partagée: keep-alive + gzip (le manifest Mojang fait ~400 Ko
+# en clair, ~8x moins compressé)
+_session = requests.Session()
+_session.headers.update({"Accept-Encoding": "gzip, deflate"})
+_session.mount("https://", requests.adapters.HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+))
+
 # Fallback versions per loader
 FALLBACK_GROUPS = {
     "vanilla": {
@@ -75,6 +95,11 @@ FALLBACK_GROUPS = {
 
 
 
+def _sort_versions(ids: List[str]) -> List[str]:
+    """Trier des ids de versions dédoublonnés, du plus récent au plus ancien."""
+    return sorted(set(ids), key=_parse_version_tuple, reverse=True)
+
+
 def _group_release_version(id_str: str) -> str:
     """Group a version ID into a family like '1.21.x'"""
     parts = id_str.split('.')
@@ -93,44 +118,40 @@ def build_groups_vanilla(manifest: Dict) -> Dict[str, List[str]]:
         "Beta": [],
         "Alpha": [],
     }
-    release_groups: Dict[str, List[str]] = {}
+    # Bucket (parsed tuple, id) pairs in a single pass; the tuples drive
+    # both the intra-group sort and the group ordering afterwards.
+    release_groups: Dict[str, List[Tuple[tuple, str]]] = defaultdict(list)
     times: Dict[str, str] = {}
 
     for v in versions:
         vid = v.get("id", "")
         vtype = v.get("type", "")
-        rtime = v.get("releaseTime") or v.get("time") or ""
         if not vid:
             continue
-        times[vid] = rtime
         if vtype == "release":
             group = _group_release_version(vid)
-            release_groups.setdefault(group, []).append(vid)
+            release_groups[group].append((_parse_version_tuple(vid), vid))
         elif vtype == "snapshot":
             specials["Snapshots"].append(vid)
+            times[vid] = v.get("releaseTime") or v.get("time") or ""
         elif vtype == "old_beta":
             specials["Beta"].append(vid)
+            times[vid] = v.get("releaseTime") or v.get("time") or ""
         elif vtype == "old_alpha":
             specials["Alpha"].append(vid)
+            times[vid] = v.get("releaseTime") or v.get("time") or ""
 
     def sort_by_time(ids: List[str]) -> List[str]:
         return sorted(set(ids), key=lambda i: times.get(i, ""), reverse=True)
-    
-    def sort_by_version(ids: List[str]) -> List[str]:
-        return sorted(set(ids), key=_parse_version_tuple, reverse=True)
 
-    for key in release_groups:
-        release_groups[key] = sort_by_version(release_groups[key])
+    for bucket in release_groups.values():
+        bucket.sort(reverse=True)
     for key in ["Snapshots", "Beta", "Alpha"]:
         specials[key] = sort_by_time(specials[key])
 
-    def latest_time_for_group(k: str) -> str:
-        lst = release_groups.get(k, [])
-        return times.get(lst[0], "") if lst else ""
-
     ordered: Dict[str, List[str]] = {}
-    for k in sorted(release_groups.keys(), key=latest_time_for_group, reverse=True):
-        ordered[k] = release_groups[k]
+    for k in sorted(release_groups, key=lambda k: release_groups[k][0][0], reverse=True):
+        ordered[k] = [vid for _, vid in release_groups[k]]
     ordered["Snapshots"] = specials["Snapshots"]
     ordered["Beta"] = specials["Beta"]
     ordered["Alpha"] = specials["Alpha"]
@@ -141,8 +162,9 @@ def build_groups_vanilla(manifest: Dict) -> Dict[str, List[str]]:
 def fetch_fabric_versions() -> Dict[str, List[str]]:
     """Fetch Fabric-supported vanilla versions from Fabric API (stable + snapshots)"""
     try:
-        with urllib.request.urlopen(f"{FABRIC_API_URL}/game", timeout=10) as resp:
-            data = json.loads(resp.read().decode('utf-8'))
+            resp = _session.get(f"{FABRIC_API_URL}/game", timeout=10)
+            resp.raise_for_status()
+            data = resp.json()
             # The API returns a list of versions with 'version' and 'stable' fields
             versions = data if isinstance(data, list) else data.get("versions", [])
             # Group by version family (both stable and snapshots)
@@ -169,11 +191,11 @@ def fetch_fabric_versions() -> Dict[str, List[str]]:
             
             # Sort each group by version number
             for key in groups:
-                groups[key] = sorted(set(groups[key]), key=_parse_version_tuple, reverse=True)
+                groups[key] = _sort_versions(groups[key])
             
             # Add snapshots if any exist
             if snapshots:
-                groups["Snapshots"] = sorted(set(snapshots), key=_parse_version_tuple, reverse=True)
+                groups["Snapshots"] = _sort_versions(snapshots)
             
             return groups
     except Exception as e:
@@ -205,11 +227,11 @@ def fetch_forge_versions(manifest: Dict) -> Dict[str, List[str]]:
                 snapshots.append(vid)
         
         for key in supported:
-            supported[key] = sorted(set(supported[key]), key=_parse_version_tuple, reverse=True)
+            supported[key] = _sort_versions(supported[key])
         
         # Add snapshots if any exist
         if snapshots:
-            supported["Snapshots"] = sorted(set(snapshots), key=_parse_version_tuple, reverse=True)
+            supported["Snapshots"] = _sort_versions(snapshots)
         
         return supported
     except Exception as e:
@@ -241,11 +263,11 @@ def fetch_neoforge_versions(manifest: Dict) -> Dict[str, List[str]]:
                 snapshots.append(vid)
         
         for key in supported:
-            supported[key] = sorted(set(supported[key]), key=_parse_version_tuple, reverse=True)
+            supported[key] = _sort_versions(supported[key])
         
         # Add snapshots if any exist
         if snapshots:
-            supported["Snapshots"] = sorted(set(snapshots), key=_parse_version_tuple, reverse=True)
+            supported["Snapshots"] = _sort_versions(snapshots)
         
         return supported
     except Exception as e:
@@ -253,10 +275,11 @@ def fetch_neoforge_versions(manifest: Dict) -> Dict[str, List[str]]:
         return {}
 
 
+@lru_cache(maxsize=4096)
 def _parse_version_tuple(version_str: str) -> Tuple[int, int, int]:
     """Parse a version string like '1.21.11' or '24w45a' into a comparable tuple"""
     # Check for snapshot format: YYwWWx (e.g. 24w45a -> Year 24, Week 45, rev a)
-    snapshot_match = re.match(r'^(\d{2})w(\d{2})([a-z])$', version_str)
+    snapshot_match = _SNAPSHOT_RE.match(version_str)
     if snapshot_match:
         year = int(snapshot_match.group(1))
         week = int(snapshot_match.group(2))
@@ -279,35 +302,119 @@ def _parse_version_tuple(version_str: str) -> Tuple[int, int, int]:
         return (0, 0, 0)
 
 
+def _manifest_cache_path() -> Path:
+    return _get_config_dir() / "manifest_cache.json"
+
+
 def fetch_manifest() -> Dict:
-    """Fetch Mojang version manifest"""
-    with urllib.request.urlopen(MOJANG_MANIFEST_URL, timeout=10) as resp:
-        data = resp.read()
-        return json.loads(data.decode('utf-8'))
+    """Fetch Mojang version manifest (GET conditionnel via ETag)"""
+    etag = None
+    cached = None
+    try:
+        with open(_manifest_cache_path(), 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+        etag = stored.get("etag")
+        cached = stored.get("manifest")
+    except Exception:
+        pass
 
+    headers = {"If-None-Match": etag} if etag and cached is not None else None
+    resp = _session.get(MOJANG_MANIFEST_URL, timeout=10, headers=headers)
+    if resp.status_code == 304 and cached is not None:
+        # Manifest inchangé côté Mojang: pas de corps à re-parser
+        return cached
+    resp.raise_for_status()
+    raw = resp.json()
+    # Ne garder que les champs consommés par les builders (id/type/releaseTime):
+    # le manifest complet fait ~400 Ko, la version élaguée ~10× moins, tant en
+    # mémoire que dans le sidecar manifest_cache.json.
+    manifest = {
+        "versions": [
+            {
+                "id": v.get("id", ""),
+                "type": v.get("type", ""),
+                "releaseTime": v.get("releaseTime") or v.get("time") or "",
+            }
+            for v in raw.get("versions", [])
+        ]
+    }
 
-def load_cache() -> Dict[str, Any]:
-    """Load cached versions for all loaders"""
-    cache_path = _cache_file_path()
-    if cache_path.exists():
+    new_etag = resp.headers.get("ETag")
+    if new_etag:
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(_manifest_cache_path(), 'w', encoding='utf-8') as f:
+                json.dump({"etag": new_etag, "manifest": manifest}, f)
         except Exception:
-            return {}
-    return {}
+            pass
+    return manifest
+
+
+# Cache mémoire du fichier versions_cache.json: un seul parse par processus,
+# maintenu à jour par save_cache
+_cache_mem: Optional[Dict[str, Any]] = None
+_cache_lock = threading.Lock()
+
+
+def load_cache() -> Dict[str, Any]:
+    """Load cached versions for all loaders (parsed once per process)"""
+    global _cache_mem
+    with _cache_lock:
+        if _cache_mem is not None:
+            return _cache_mem
+        cache_path = _cache_file_path()
+        data: Dict[str, Any] = {}
+        if cache_path.exists():
+            try:
+                with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception:
+                data = {}
+        else:
+            # Migration depuis l'ancien cache en clair (une seule fois)
+            legacy_path = _legacy_cache_file_path()
+            if legacy_path.exists():
+                try:
+                    with open(legacy_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except Exception:
+                    data = {}
+        _cache_mem = data
+        return data
 
 
 def save_cache(cache: Dict[str, Any]):
-    """Save versions cache to file"""
+    """Save versions cache to file (atomic write via temp file + rename)"""
+    global _cache_mem
+    with _cache_lock:
+        _cache_mem = cache
     try:
         cache_path = _cache_file_path()
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2, ensure_ascii=False)
+        tmp_path = cache_path.with_suffix('.gz.tmp')
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+        # L'ancien cache en clair ne sert plus une fois le .gz écrit
+        try:
+            _legacy_cache_file_path().unlink()
+        except OSError:
+            pass
     except Exception:
         pass
 
 
+def get_cached_version_groups(loader: str = "vanilla") -> Dict[str, List[str]]:
+    """Version groups without any network access.
+
+    Returns the persisted cache for the loader if present, else the
+    built-in fallback — callers are expected to kick an async refresh
+    (stale-while-revalidate).
+    """
+    cached = load_cache().get(loader)
+    if isinstance(cached, dict) and cached:
+        return cached
+    return FALLBACK_GROUPS.get(loader, {}).copy()
+
+
 def get_version_groups(loader: str = "vanilla") -> Dict[str, List[str]]:
     """Get version groups for a specific loader, cache-first approach"""
     cache = load_cache()
@@ -364,8 +471,9 @@ def refresh_version_groups_async(loader: str = "vanilla", callback=None):
             
             if groups:
                 cache = load_cache()
-                cache[loader] = groups
-                save_cache(cache)
+                if groups != cache.get(loader):
+                    cache[loader] = groups
+                    save_cache(cache)
                 if callback:
                     callback(groups)
         except Exception as e:
@@ -374,3 +482,47 @@ def refresh_version_groups_async(loader: str = "vanilla", callback=None):
     thread = threading.Thread(target=_refresh, daemon=True)
     thread.start()
 
+
+def refresh_all_async(callback=None):
+    """Rafraîchir les quatre loaders en une passe d'arrière-plan.
+
+    Le manifest Mojang n'est téléchargé qu'une fois (vanilla, forge et
+    neoforge le partagent), les groupes sont construits en parallèle et le
+    cache n'est écrit qu'une fois. `callback` reçoit le dict complet
+    {loader: groups} des loaders rafraîchis avec succès.
+    """
+    def _refresh():
+        try:
+            from concurrent.futures import ThreadPoolExecutor
+
+            manifest = fetch_manifest()
+            builders = {
+                "vanilla": lambda: build_groups_vanilla(manifest),
+                "fabric": fetch_fabric_versions,
+                "forge": lambda: fetch_forge_versions(manifest),
+                "neoforge": lambda: fetch_neoforge_versions(manifest),
+            }
+            results = {}
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = {name: executor.submit(fn) for name, fn in builders.items()}
+                for name, future in futures.items():
+                    try:
+                        groups = future.result()
+                    except Exception as e:
+                        print(f"Refresh failed for {name}: {e}")
+                        continue
+                    if groups:
+                        results[name] = groups
+            if results:
+                cache = load_cache()
+                changed = {k: v for k, v in results.items() if v != cache.get(k)}
+                if changed:
+                    cache.update(changed)
+                    save_cache(cache)
+                if callback:
+                    callback(results)
+        except Exception as e:
+            print(f"Async refresh failed: {e}")
+
+    threading.Thread(target=_refresh, daemon=True).start()
+